@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Simple build script for Transaction Matcher EXE
-Creates ONLY the single executable file
+Creates a one-folder build (no per-launch extraction) zipped for distribution
 """
 import os
 import sys
@@ -9,6 +9,32 @@ import shutil
 import subprocess
 from pathlib import Path
 
+# Modules PyInstaller would otherwise sweep in that the app never imports.
+# unittest is left in: numpy.testing imports it at runtime.
+EXCLUDED_MODULES = [
+    "tkinter",
+    "pydoc",
+    "distutils",
+    "test",
+    "xml.dom",
+    "pytest",
+    "setuptools",
+]
+
+def check_virtualenv():
+    """Check that the build runs inside a virtual environment"""
+    if sys.prefix == sys.base_prefix:
+        print("❌ Not running inside a virtual environment")
+        print("   PyInstaller would scan the system site-packages and bundle dev tools.")
+        print("   Create a clean venv with only the app's dependencies, e.g.:")
+        print("     python -m venv build_venv")
+        print("     build_venv\\Scripts\\activate")
+        print("     pip install PyQt5 pandas numpy openpyxl lxml fuzzywuzzy pyinstaller")
+        print("     python build_exe.py")
+        return False
+    print(f"✓ Virtual environment: {sys.prefix}")
+    return True
+
 def check_pyinstaller():
     """Check if PyInstaller is installed"""
     try:
@@ -23,29 +49,52 @@ def check_pyinstaller():
 
 def clean_previous():
     """Clean only what's necessary"""
-    if os.path.exists('build'):
-        shutil.rmtree('build')
-    if os.path.exists('dist'):
-        shutil.rmtree('dist')
+    shutil.rmtree('build', ignore_errors=True)
+    shutil.rmtree('dist', ignore_errors=True)
     # Remove old spec files
-    for spec in Path('.').glob('*.spec'):
-        spec.unlink()
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.endswith('.spec') and entry.is_file():
+                os.unlink(entry.path)
+
+def find_upx_dir():
+    """Return the directory containing UPX, or None if UPX is not available"""
+    upx_dir = os.environ.get("UPX_DIR")
+    if upx_dir and os.path.isdir(upx_dir):
+        return upx_dir
+    upx_exe = shutil.which("upx")
+    if upx_exe:
+        return os.path.dirname(upx_exe)
+    return None
 
 def build_single_exe():
-    """Build only the EXE file"""
+    """Build the EXE folder"""
     print("🔨 Building TransactionMatcher.exe...")
     
     cmd = [
-        "pyinstaller",
+        sys.executable, "-m", "PyInstaller",  # PyInstaller from the active venv
         "src/main.py",                  # CHANGED: Use main.py instead of gui_launcher.py
-        "--onefile",                    # Single EXE only
+        "--onedir",                     # No temp extraction on every launch
         "--name", "TransactionMatcher", # EXE name
         "--windowed",                   # No console window
         "--add-data", "src;src",        # Include source code
+        "--paths", "src",               # Resolve app imports from src only
         "--hidden-import", "PyQt5.sip", # PyQt5 compatibility
+        "--optimize", "2",              # Strip docstrings/asserts from bundled bytecode
         "--clean"                       # Clean build
     ]
     
+    for module in EXCLUDED_MODULES:
+        cmd += ["--exclude-module", module]
+    
+    upx_dir = find_upx_dir()
+    if upx_dir:
+        print(f"✓ UPX found: {upx_dir}")
+        cmd += ["--upx-dir", upx_dir]
+    else:
+        print("⚠ UPX not found, building uncompressed")
+        cmd.append("--noupx")
+    
     try:
         subprocess.run(cmd, check=True)
         return True
@@ -63,6 +112,9 @@ def main():
         print("❌ Run from project root (folder with 'src' directory)")
         sys.exit(1)
     
+    if not check_virtualenv():
+        sys.exit(1)
+    
     if not check_pyinstaller():
         sys.exit(1)
     
@@ -72,24 +124,24 @@ def main():
     if not build_single_exe():
         sys.exit(1)
     
-    # Check result and copy to project root
-    exe_path = Path("dist/TransactionMatcher.exe")
+    # Check result and zip the folder into the project root
+    app_dir = Path("dist/TransactionMatcher")
+    exe_path = app_dir / "TransactionMatcher.exe"
     if exe_path.exists():
-        size_mb = exe_path.stat().st_size / (1024 * 1024)
+        size_mb = sum(p.stat().st_size for p in app_dir.rglob('*') if p.is_file()) / (1024 * 1024)
         
-        # Copy EXE to project root
-        final_exe = Path("TransactionMatcher.exe")
-        shutil.copy2(exe_path, final_exe)
+        # Zip the app folder for shipping
+        final_zip = Path(shutil.make_archive("TransactionMatcher", "zip", "dist", "TransactionMatcher"))
         
         # Clean up build artifacts
         shutil.rmtree('build', ignore_errors=True)
         shutil.rmtree('dist', ignore_errors=True)
         
         print(f"\n🎉 Success!")
-        print(f"📁 Created: {final_exe}")
-        print(f"📏 Size: {size_mb:.1f} MB")
+        print(f"📁 Created: {final_zip.name}")
+        print(f"📏 Size: {size_mb:.1f} MB (unzipped)")
         print(f"🧹 Cleaned up build folders")
-        print(f"\n✅ Ready to distribute: Just share TransactionMatcher.exe")
+        print(f"\n✅ Ready to distribute: Share {final_zip.name} and run TransactionMatcher.exe from the extracted folder")
     else:
         print("❌ EXE not found!")
         sys.exit(1)
@@ -5,10 +5,37 @@ Handles all configuration settings including zoom preferences, UI settings, and
 
 import os
 import json
+import bisect
+import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from PyQt5.QtCore import QSettings, QStandardPaths
 
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        # No indent keeps json on its C encoder
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    
+    _json_loads = json.loads
+
+
+_log = logging.getLogger(__name__)
+
+
+def _scale_font_sizes(base_items: Tuple[Tuple[str, int], ...], zoom_level: int) -> Dict[str, int]:
+    """Scale (element_type, base_size) pairs to a zoom level (minimum 6pt font)"""
+    zoom_factor = zoom_level / 100.0
+    return {element_type: max(6, int(base_size * zoom_factor))
+            for element_type, base_size in base_items}
+
 
 class AppConfig:
     """
@@ -21,7 +48,12 @@ class AppConfig:
     MIN_ZOOM_LEVEL = 50
     MAX_ZOOM_LEVEL = 300
     ZOOM_INCREMENT = 25
-    ZOOM_LEVELS = [50, 75, 90, 100, 110, 125, 150, 175, 200, 250, 300]
+    ZOOM_LEVELS = (50, 75, 90, 100, 110, 125, 150, 175, 200, 250, 300)
+    _ZOOM_LEVELS_SET = frozenset(ZOOM_LEVELS)
+    
+    # Neighbouring predefined level for each predefined level (clamped at the ends)
+    _ZOOM_IN_NEXT = dict(zip(ZOOM_LEVELS, ZOOM_LEVELS[1:] + ZOOM_LEVELS[-1:]))
+    _ZOOM_OUT_NEXT = dict(zip(ZOOM_LEVELS, ZOOM_LEVELS[:1] + ZOOM_LEVELS[:-1]))
     
     # Default font sizes for different UI elements (at 100% zoom)
     BASE_FONT_SIZES = {
@@ -36,25 +68,54 @@ class AppConfig:
         'menu': 9,
         'tooltip': 8
     }
+    BASE_FONT_SIZES_VIEW = MappingProxyType(BASE_FONT_SIZES)
+    _BASE_ITEMS = tuple(BASE_FONT_SIZES.items())
+    
+    # Expected Python type for persisted settings, converted once on first read
+    _SETTINGS_TYPES = {
+        'zoom_level': int,
+        'last_fee_file': str,
+        'last_transaction_file': str,
+        'last_export_dir': str,
+    }
     
     def __init__(self):
         """Initialize configuration manager with default settings"""
-        # Use QSettings for cross-platform config storage
-        self.settings = QSettings('TransactionMatcher', 'FeeMatcher')
+        # QSettings is created on first use so headless imports skip the registry/INI
+        self._settings = None
         
         # Current configuration values
         self._zoom_level = self.DEFAULT_ZOOM_LEVEL
-        self._font_sizes = self.BASE_FONT_SIZES.copy()
         self._ui_preferences = {}
         self._file_paths = {}
+        self._update_scaled_font_sizes()
         
-        # Load existing configuration
-        self.load_configuration()
+        # Values already read from (or written to) QSettings, keyed by setting name
+        self._settings_cache = {}
+        
+        # Changed settings not yet written to QSettings, flushed by save_configuration()
+        self._dirty_keys = {}
+        
+        # Persisted configuration is loaded on first access
+        self._loaded = False
+    
+    @property
+    def settings(self) -> QSettings:
+        """Cross-platform config storage, created on first access"""
+        if self._settings is None:
+            self._settings = QSettings('TransactionMatcher', 'FeeMatcher')
+        return self._settings
+    
+    def _ensure_loaded(self):
+        """Load persisted configuration if it has not been loaded yet"""
+        if not self._loaded:
+            self.load_configuration()
     
     # ========== Zoom Configuration ==========
     
     def get_zoom_level(self) -> int:
         """Get current zoom level percentage"""
+        self._ensure_loaded()
         return self._zoom_level
     
     def set_zoom_level(self, zoom_level: int) -> bool:
@@ -67,7 +128,11 @@ class AppConfig:
         Returns:
             bool: True if valid and set, False otherwise
         """
+        self._ensure_loaded()
         if self.MIN_ZOOM_LEVEL <= zoom_level <= self.MAX_ZOOM_LEVEL:
+            if zoom_level == self._zoom_level:
+                # Font sizes already match (e.g. slider repeats, reapplying saved level)
+                return True
             self._zoom_level = zoom_level
             self._update_scaled_font_sizes()
             return True
@@ -83,6 +148,13 @@ class AppConfig:
         Returns:
             int: Next zoom level, or current if at limit
         """
+        self._ensure_loaded()
+        table = self._ZOOM_IN_NEXT if direction == 'in' else self._ZOOM_OUT_NEXT
+        next_level = table.get(self._zoom_level)
+        if next_level is not None and direction in ('in', 'out'):
+            return next_level
+        
+        # Off-grid zoom level - step from the closest predefined level
         current_index = self._find_closest_zoom_index()
         
         if direction == 'in' and current_index < len(self.ZOOM_LEVELS) - 1:
@@ -94,16 +166,22 @@ class AppConfig:
     
     def _find_closest_zoom_index(self) -> int:
         """Find the index of the closest predefined zoom level"""
-        closest_index = 0
-        min_diff = abs(self.ZOOM_LEVELS[0] - self._zoom_level)
+        levels = self.ZOOM_LEVELS
+        zoom = self._zoom_level
+        i = bisect.bisect_left(levels, zoom)
         
-        for i, level in enumerate(self.ZOOM_LEVELS):
-            diff = abs(level - self._zoom_level)
-            if diff < min_diff:
-                min_diff = diff
-                closest_index = i
-                
-        return closest_index
+        if i == 0:
+            return 0
+        if i == len(levels):
+            return i - 1
+        
+        # Ties resolve to the lower level
+        return i if levels[i] - zoom < zoom - levels[i - 1] else i - 1
+    
+    @classmethod
+    def is_predefined_zoom_level(cls, zoom_level: int) -> bool:
+        """Check whether a zoom level is one of the predefined ZOOM_LEVELS"""
+        return zoom_level in cls._ZOOM_LEVELS_SET
     
     def reset_zoom(self):
         """Reset zoom to default level"""
@@ -121,115 +199,147 @@ class AppConfig:
         Returns:
             int: Font size in points
         """
-        return self._font_sizes.get(element_type, self.BASE_FONT_SIZES.get(element_type, 9))
+        self._ensure_loaded()
+        return self._font_sizes.get(element_type, 9)
     
-    def get_all_font_sizes(self) -> Dict[str, int]:
-        """Get all current font sizes"""
-        return self._font_sizes.copy()
+    def get_all_font_sizes(self) -> Mapping[str, int]:
+        """Get all current font sizes (read-only view)"""
+        self._ensure_loaded()
+        return self._font_sizes_view
     
-    def get_base_font_sizes(self) -> Dict[str, int]:
-        """Get base font sizes (100% zoom)"""
-        return self.BASE_FONT_SIZES.copy()
+    def get_base_font_sizes(self) -> Mapping[str, int]:
+        """Get base font sizes at 100% zoom (read-only view)"""
+        return self.BASE_FONT_SIZES_VIEW
     
     def _update_scaled_font_sizes(self):
         """Update font sizes based on current zoom level"""
-        zoom_factor = self._zoom_level / 100.0
-        
-        for element_type, base_size in self.BASE_FONT_SIZES.items():
-            scaled_size = max(6, int(base_size * zoom_factor))  # Minimum 6pt font
-            self._font_sizes[element_type] = scaled_size
+        if self._zoom_level in self._ZOOM_LEVELS_SET:
+            # Predefined levels share a precomputed table - never mutate it
+            self._font_sizes = self._FONT_TABLE[self._zoom_level]
+        else:
+            self._font_sizes = _scale_font_sizes(self._BASE_ITEMS, self._zoom_level)
+        self._font_sizes_view = MappingProxyType(self._font_sizes)
     
     # ========== UI Preferences ==========
     
     def get_ui_preference(self, key: str, default: Any = None) -> Any:
         """Get a UI preference value"""
+        self._ensure_loaded()
         return self._ui_preferences.get(key, default)
     
     def set_ui_preference(self, key: str, value: Any):
         """Set a UI preference value"""
+        self._ensure_loaded()
         self._ui_preferences[key] = value
     
     def get_window_geometry(self) -> Optional[bytes]:
         """Get saved window geometry"""
-        return self.settings.value('window_geometry')
+        return self._get_setting('window_geometry')
     
     def set_window_geometry(self, geometry: bytes):
         """Save window geometry"""
-        self.settings.setValue('window_geometry', geometry)
+        self._set_setting('window_geometry', geometry)
     
     def get_window_state(self) -> Optional[bytes]:
         """Get saved window state"""
-        return self.settings.value('window_state')
+        return self._get_setting('window_state')
     
     def set_window_state(self, state: bytes):
         """Save window state"""
-        self.settings.setValue('window_state', state)
+        self._set_setting('window_state', state)
     
     # ========== File Path Management ==========
     
     def get_last_fee_file_path(self) -> str:
         """Get the last used fee record file path"""
-        return self.settings.value('last_fee_file', '')
+        return self._get_setting('last_fee_file', '')
     
     def set_last_fee_file_path(self, path: str):
         """Save the last used fee record file path"""
-        self.settings.setValue('last_fee_file', path)
+        self._set_setting('last_fee_file', path)
     
     def get_last_transaction_file_path(self) -> str:
         """Get the last used transaction file path"""
-        return self.settings.value('last_transaction_file', '')
+        return self._get_setting('last_transaction_file', '')
     
     def set_last_transaction_file_path(self, path: str):
         """Save the last used transaction file path"""
-        self.settings.setValue('last_transaction_file', path)
+        self._set_setting('last_transaction_file', path)
     
     def get_last_export_directory(self) -> str:
         """Get the last used export directory"""
-        default_dir = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
-        return self.settings.value('last_export_dir', default_dir)
+        if 'last_export_dir' not in self._settings_cache:
+            default_dir = QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation)
+            return self._get_setting('last_export_dir', default_dir)
+        return self._settings_cache['last_export_dir']
     
     def set_last_export_directory(self, path: str):
         """Save the last used export directory"""
-        self.settings.setValue('last_export_dir', path)
+        self._set_setting('last_export_dir', path)
     
     # ========== Configuration Persistence ==========
     
+    def _get_setting(self, key: str, default: Any = None) -> Any:
+        """Read a persisted setting, hitting QSettings only on first access"""
+        if key not in self._settings_cache:
+            value_type = self._SETTINGS_TYPES.get(key)
+            if value_type is None:
+                value = self.settings.value(key, default)
+            else:
+                value = self.settings.value(key, default, type=value_type)
+            self._settings_cache[key] = value
+        return self._settings_cache[key]
+    
+    def _set_setting(self, key: str, value: Any):
+        """Update a persisted setting in the cache; written out on the next flush"""
+        self._settings_cache[key] = value
+        self._dirty_keys[key] = value
+    
     def load_configuration(self):
         """Load configuration from persistent storage"""
+        self._loaded = True
         try:
             # Load zoom level
-            saved_zoom = self.settings.value('zoom_level', self.DEFAULT_ZOOM_LEVEL, type=int)
+            saved_zoom = self._get_setting('zoom_level', self.DEFAULT_ZOOM_LEVEL)
             self.set_zoom_level(saved_zoom)
             
             # Load UI preferences
-            ui_prefs = self.settings.value('ui_preferences', {})
+            ui_prefs = self._get_setting('ui_preferences', {})
             if isinstance(ui_prefs, dict):
                 self._ui_preferences = ui_prefs
             
         except Exception as e:
-            print(f"Warning: Failed to load configuration: {e}")
+            _log.warning("Failed to load configuration: %s", e)
             # Use defaults if loading fails
             self.reset_to_defaults()
     
     def save_configuration(self):
         """Save current configuration to persistent storage"""
         try:
-            # Save zoom level
-            self.settings.setValue('zoom_level', self._zoom_level)
-            
-            # Save UI preferences
-            self.settings.setValue('ui_preferences', self._ui_preferences)
+            # Zoom and UI preferences only exist once loaded - otherwise nothing changed
+            if self._loaded:
+                self._set_setting('zoom_level', self._zoom_level)
+                self._set_setting('ui_preferences', self._ui_preferences)
             
-            # Ensure settings are written to disk
-            self.settings.sync()
+            self.flush()
             
         except Exception as e:
-            print(f"Warning: Failed to save configuration: {e}")
+            _log.warning("Failed to save configuration: %s", e)
+    
+    def flush(self):
+        """Write all pending setting changes to disk in a single sync"""
+        if not self._dirty_keys:
+            return
+        
+        for key, value in self._dirty_keys.items():
+            self.settings.setValue(key, value)
+        self.settings.sync()
+        self._dirty_keys.clear()
     
     def reset_to_defaults(self):
         """Reset all configuration to default values"""
+        self._loaded = True
         self._zoom_level = self.DEFAULT_ZOOM_LEVEL
-        self._font_sizes = self.BASE_FONT_SIZES.copy()
         self._ui_preferences = {}
         self._file_paths = {}
         self._update_scaled_font_sizes()
@@ -244,6 +354,7 @@ class AppConfig:
         Returns:
             bool: True if successful, False otherwise
         """
+        self._ensure_loaded()
         try:
             config_data = {
                 'zoom_level': self._zoom_level,
@@ -252,12 +363,12 @@ class AppConfig:
                 'version': '1.0'
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            # Encode in memory and write in a single call
+            Path(file_path).write_bytes(_json_dumps(config_data))
             
             return True
         except Exception as e:
-            print(f"Error exporting configuration: {e}")
+            _log.error("Error exporting configuration: %s", e)
             return False
     
     def import_configuration(self, file_path: str) -> bool:
@@ -270,12 +381,12 @@ class AppConfig:
         Returns:
             bool: True if successful, False otherwise
         """
+        self._ensure_loaded()
         try:
             if not os.path.exists(file_path):
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            config_data = _json_loads(Path(file_path).read_bytes())
             
             # Import zoom level
             if 'zoom_level' in config_data:
@@ -287,12 +398,26 @@ class AppConfig:
             
             return True
         except Exception as e:
-            print(f"Error importing configuration: {e}")
+            _log.error("Error importing configuration: %s", e)
             return False
 
 
-# Global configuration instance
-_global_config = None
+# Scaled font sizes for every predefined zoom level, built once at import
+AppConfig._FONT_TABLE = {
+    zoom_level: _scale_font_sizes(AppConfig._BASE_ITEMS, zoom_level)
+    for zoom_level in AppConfig.ZOOM_LEVELS
+}
+
+
+# Global configuration instance (_config) is created on first access via __getattr__
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global configuration instance on first module attribute access"""
+    if name == '_config':
+        config = globals()['_config'] = AppConfig()
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_config() -> AppConfig:
@@ -302,16 +427,18 @@ def get_config() -> AppConfig:
     Returns:
         AppConfig: Global configuration manager
     """
-    global _global_config
-    if _global_config is None:
-        _global_config = AppConfig()
-    return _global_config
+    try:
+        return _config
+    except NameError:
+        # Global name lookups bypass module __getattr__, so trigger it once here
+        return __getattr__('_config')
 
 
 def save_config():
     """Save the global configuration"""
-    if _global_config:
-        _global_config.save_configuration()
+    config = globals().get('_config')
+    if config:
+        config.save_configuration()
 
 
 # Automatically save configuration on module cleanup
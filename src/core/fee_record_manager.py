@@ -5,13 +5,137 @@ AUTO CLEAR: Removes all highlights (red, yellow, light blue) before each new dat
 File: src/core/fee_record_manager.py
 """
 import pandas as pd
+import numpy as np
 import openpyxl
 from openpyxl.utils import column_index_from_string, get_column_letter
 from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+from openpyxl.worksheet.merge import MergedCellRange
 from typing import List, Dict, Tuple, Optional, Any, Set
 from datetime import datetime
 import os
+import re
+import logging
+import bisect
+from array import array
 import shutil
+from collections import Counter
+from collections.abc import Mapping
+from functools import lru_cache, partial
+
+if os.name == 'nt':
+    import msvcrt
+
+
+_log = logging.getLogger(__name__)
+
+# Field order of the (row, col, type, value, parent, month) tuples kept in
+# updated_cells / conflict_cells
+_CELL_RECORD_FIELDS = ('row', 'col', 'type', 'value', 'parent', 'month')
+
+# Currency symbols and thousands separators stripped before parsing amounts
+_AMOUNT_STRIP_RE = re.compile(r'[,$]|RM')
+_AMOUNT_DROP_TABLE = str.maketrans('', '', ',$')
+
+
+def _strip_amount_symbols(amount_str: str) -> str:
+    """Same result as _AMOUNT_STRIP_RE.sub('', amount_str) without the regex engine"""
+    return amount_str.replace('RM', '').translate(_AMOUNT_DROP_TABLE)
+
+
+@lru_cache(maxsize=2048)
+def _format_amount_smart(amount_str: str) -> str:
+    """Format an amount string for display, cached since fee amounts repeat a lot"""
+    if not amount_str or not amount_str.strip():
+        return ""
+        
+    try:
+        # Clean the amount string
+        cleaned = _strip_amount_symbols(amount_str).strip()
+        if not cleaned:
+            return ""
+            
+        amount_float = float(cleaned)
+        
+        # Check if it's a whole number (no fractional part)
+        if amount_float == int(amount_float):
+            return str(int(amount_float))  # Return as integer: "100"
+        else:
+            # Format with 2 decimals, then remove trailing zeros
+            formatted = f"{amount_float:.2f}"
+            # Remove trailing zeros: "100.50" → "100.5", "100.00" → "100"
+            formatted = formatted.rstrip('0').rstrip('.')
+            return formatted
+            
+    except (ValueError, TypeError):
+        # If parsing fails, return original string
+        return amount_str.strip()
+
+
+@lru_cache(maxsize=2048)
+def _parse_cell_number(value_str: str) -> Optional[Tuple[Any, str]]:
+    """
+    Parse an amount string into the (value, number format) pair written to a cell,
+    or None when it isn't numeric. An empty amount gives ("", "") - value only.
+    """
+    try:
+        # Clean the value string
+        cleaned = _strip_amount_symbols(value_str).strip()
+        if not cleaned:
+            return "", ""
+            
+        # Convert to float first
+        number_value = float(cleaned)
+        
+        # If it's a whole number, store as integer and set format to show no decimals
+        if number_value == int(number_value):
+            # FORCE Excel to display as integer (no decimals)
+            return int(number_value), '0'
+        
+        # Store as float and format to show decimals only when needed
+        return number_value, '0.##'
+            
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=4)
+def _read_file_header_row(file_path: str, mtime_ns: int, size: int) -> Tuple[Any, ...]:
+    """Read row 1 of a workbook's active sheet; mtime_ns and size only key the cache"""
+    # Read-only mode streams the sheet XML instead of building the full cell grid;
+    # this copy is never saved, so external link parts can be skipped too
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        return FeeRecordManager._read_header_row(workbook.active)
+    finally:
+        workbook.close()
+
+
+class _LazyDict(Mapping):
+    """Read-only mapping that builds its contents on first access"""
+    
+    def __init__(self, factory):
+        self._factory = factory
+        self._data = None
+    
+    def _resolve(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = self._factory()
+            self._factory = None
+        return self._data
+    
+    def __getitem__(self, key):
+        return self._resolve()[key]
+    
+    def __iter__(self):
+        return iter(self._resolve())
+    
+    def __len__(self):
+        return len(self._resolve())
+    
+    def __repr__(self):
+        return repr(self._resolve())
 
 
 class FeeRecordManager:
@@ -25,12 +149,21 @@ class FeeRecordManager:
         "Oct": "OCTOBER", "Nov": "NOVEMBER", "Dec": "DECEMBER"
     }
     
+    # Assign fills by workbook fill index through openpyxl's private style
+    # array instead of the cell.fill descriptor (falls back automatically)
+    FAST_FILL_ASSIGNMENT = True
+    
     # Chronological month order for proper insertion
     MONTH_ORDER = {
         "JANUARY": 1, "FEBRUARY": 2, "MARCH": 3, "APRIL": 4,
         "MAY": 5, "JUNE": 6, "JULY": 7, "AUGUST": 8,
         "SEPTEMBER": 9, "OCTOBER": 10, "NOVEMBER": 11, "DECEMBER": 12
     }
+    MONTH_BY_ORDER = {order: month for month, order in MONTH_ORDER.items()}
+    
+    # Month header styles, shared so each new header reuses the same objects
+    _BOLD_FONT = Font(bold=True)
+    _HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
     
     def __init__(self):
         self.workbook = None
@@ -39,6 +172,22 @@ class FeeRecordManager:
         self.column_mapping = {}
         self.parent_column = 1
         
+        # Upper-cased parent name -> first row holding that parent
+        self._parent_row_index: Dict[str, int] = {}
+        # Row a new parent goes into; tracked so max_row (a scan over every
+        # cell) is only computed once per load
+        self._next_parent_row = 2
+        
+        # Existing month orders (ascending) and, for each prefix of that list,
+        # the leftmost date column - lets insertion points be found by bisect
+        self._month_orders: List[int] = []
+        self._month_prefix_min_cols: List[int] = []
+        
+        # column_mapping as arrays indexed by MONTH_ORDER (0 = month not in the
+        # sheet) for the row writes and column shifts; column_mapping stays the API
+        self._date_cols = self._empty_month_cols()
+        self._amount_cols = self._empty_month_cols()
+        
         # Cell styling for highlighting
         self.highlight_fill = PatternFill(
             start_color="FFFF00", end_color="FFFF00", fill_type="solid"
@@ -49,6 +198,7 @@ class FeeRecordManager:
         self.new_parent_fill = PatternFill(
             start_color="E6F3FF", end_color="E6F3FF", fill_type="solid"
         )
+        self.no_fill = PatternFill()
         
         # Colors to clear automatically (RGB hex values)
         self.colors_to_clear = {
@@ -57,10 +207,14 @@ class FeeRecordManager:
             "E6F3FF"     # Light blue (new_parent_fill)
         }
         
+        # id(fill) -> workbook fill index, resolved once per loaded workbook
+        self._fill_ids: Dict[int, int] = {}
+        
         # Track updated cells
         self.updated_cells = []
         self.conflict_cells = []
         self.cleared_cells_count = 0
+        self.new_parents_count = 0
     
     def _clear_all_highlights(self):
         """
@@ -72,31 +226,74 @@ class FeeRecordManager:
             
         self.cleared_cells_count = 0
         
-        print("🧹 Clearing previous highlights before loading new data...")
+        _log.info("Clearing previous highlights before loading new data")
+        
+        # Match colours once per entry in the workbook's fill table, then the
+        # cell scan only compares fill indexes
+        fills = getattr(self.workbook, '_fills', None)
+        clearable_ids = None
+        if fills is not None:
+            clearable_ids = {
+                fill_id for fill_id, fill in enumerate(fills) if self._is_clearable_fill(fill)
+            }
         
         # Scan all cells in the used range
-        for row in range(1, self.worksheet.max_row + 1):
-            for col in range(1, self.worksheet.max_column + 1):
-                cell = self.worksheet.cell(row=row, column=col)
+        for cells in self.worksheet.iter_rows(min_row=1, max_row=self.worksheet.max_row,
+                                              max_col=self.worksheet.max_column):
+            for cell in cells:
+                if clearable_ids is None:
+                    clear = self._is_clearable_fill(cell.fill)
+                else:
+                    # Unstyled cells have no style array yet and use fill 0
+                    style = cell._style
+                    clear = (style.fillId if style else 0) in clearable_ids
                 
-                # Check if cell has a fill color we want to clear
-                if cell.fill and hasattr(cell.fill, 'start_color') and cell.fill.start_color:
-                    cell_color = str(cell.fill.start_color.rgb) if cell.fill.start_color.rgb else ""
-                    
-                    # Remove the '00' prefix if present (openpyxl sometimes adds it)
-                    if cell_color.startswith('00') and len(cell_color) == 8:
-                        cell_color = cell_color[2:]
-                    
-                    # Clear if it matches any of our highlight colors
-                    if cell_color.upper() in self.colors_to_clear:
-                        # Remove fill while preserving other formatting
-                        cell.fill = PatternFill()  # Reset to no fill
-                        self.cleared_cells_count += 1
+                if clear:
+                    # Remove fill while preserving other formatting
+                    self._apply_fill(cell, self.no_fill)  # Reset to no fill
+                    self.cleared_cells_count += 1
         
         if self.cleared_cells_count > 0:
-            print(f"✓ Cleared {self.cleared_cells_count} highlighted cells")
+            _log.info("Cleared %d highlighted cells", self.cleared_cells_count)
         else:
-            print("✓ No previous highlights found to clear")
+            _log.info("No previous highlights found to clear")
+    
+    def _is_clearable_fill(self, fill) -> bool:
+        """Check if a fill uses one of the highlight colours we clear"""
+        if not (fill and hasattr(fill, 'start_color') and fill.start_color):
+            return False
+        
+        cell_color = str(fill.start_color.rgb) if fill.start_color.rgb else ""
+        
+        # Remove the '00' prefix if present (openpyxl sometimes adds it)
+        if cell_color.startswith('00') and len(cell_color) == 8:
+            cell_color = cell_color[2:]
+        
+        return cell_color.upper() in self.colors_to_clear
+    
+    def _register_fills(self):
+        """
+        Add our fills to the workbook's fill table once and remember their indexes
+        so each cell update is an index assignment rather than a fill hash lookup
+        """
+        self._fill_ids = {}
+        fills = getattr(self.workbook, '_fills', None)
+        if not self.FAST_FILL_ASSIGNMENT or fills is None:
+            return
+        
+        for fill in (self.no_fill, self.highlight_fill, self.conflict_fill, self.new_parent_fill):
+            self._fill_ids[id(fill)] = fills.add(fill)
+    
+    def _apply_fill(self, cell, fill: PatternFill):
+        """Set a cell's fill (same effect as cell.fill = fill)"""
+        fill_id = self._fill_ids.get(id(fill))
+        if fill_id is None:
+            cell.fill = fill
+            return
+        
+        if not cell._style:
+            cell._style = StyleArray()
+        cell._style.fillId = fill_id
     
     def _format_amount_smart(self, amount_str: str) -> str:
         """
@@ -104,59 +301,22 @@ class FeeRecordManager:
         - Whole numbers: 100 → "100" 
         - With decimals: 100.50 → "100.5", 100.75 → "100.75"
         """
-        if not amount_str or not amount_str.strip():
-            return ""
-            
-        try:
-            # Clean the amount string
-            cleaned = amount_str.replace(',', '').replace('$', '').replace('RM', '').strip()
-            if not cleaned:
-                return ""
-                
-            amount_float = float(cleaned)
-            
-            # Check if it's a whole number (no fractional part)
-            if amount_float == int(amount_float):
-                return str(int(amount_float))  # Return as integer: "100"
-            else:
-                # Format with 2 decimals, then remove trailing zeros
-                formatted = f"{amount_float:.2f}"
-                # Remove trailing zeros: "100.50" → "100.5", "100.00" → "100"
-                formatted = formatted.rstrip('0').rstrip('.')
-                return formatted
-                
-        except (ValueError, TypeError):
-            # If parsing fails, return original string
-            return amount_str.strip()
+        return _format_amount_smart(amount_str)
     
     def _set_cell_value_as_number(self, cell, value_str: str):
         """
         Set cell value as actual number AND override Excel's number format
         """
-        try:
-            # Clean the value string
-            cleaned = value_str.replace(',', '').replace('$', '').replace('RM', '').strip()
-            if not cleaned:
-                cell.value = ""
-                return
-                
-            # Convert to float first
-            number_value = float(cleaned)
-            
-            # If it's a whole number, store as integer and set format to show no decimals
-            if number_value == int(number_value):
-                cell.value = int(number_value)
-                # FORCE Excel to display as integer (no decimals)
-                cell.number_format = '0'
-            else:
-                # Store as float and set format to remove trailing zeros
-                cell.value = number_value
-                # Format to show decimals only when needed
-                cell.number_format = '0.##'
-                
-        except (ValueError, TypeError):
+        parsed = _parse_cell_number(value_str)
+        if parsed is None:
             # If conversion fails, store as text
             cell.value = value_str
+            return
+        
+        number_value, number_format = parsed
+        cell.value = number_value
+        if number_format:
+            cell.number_format = number_format
 
     def load_table_data_to_fee_record(self, table_data: List[List[str]], 
                                      fee_record_file_path: str) -> Dict[str, Any]:
@@ -178,7 +338,12 @@ class FeeRecordManager:
             
             try:
                 self.fee_record_path = fee_record_file_path
-                self.workbook = openpyxl.load_workbook(fee_record_file_path)
+                # Formulas are kept as their source strings (data_only=False) and
+                # VBA/rich-text runs are not parsed; external links are kept since
+                # dropping them would remove them from the saved file
+                self.workbook = openpyxl.load_workbook(
+                    fee_record_file_path, data_only=False, keep_vba=False, rich_text=False
+                )
                 self.worksheet = self.workbook.active
             except PermissionError as e:
                 return {
@@ -191,6 +356,8 @@ class FeeRecordManager:
                     "error": f"Failed to open Excel file. Error: {str(e)}"
                 }
             
+            self._register_fills()
+            
             # 🧹 AUTOMATIC COLOR CLEARING - Clear all highlights before processing new data
             self._clear_all_highlights()
             
@@ -200,20 +367,24 @@ class FeeRecordManager:
             # Add clearing statistics to result
             stats["cleared_cells"] = self.cleared_cells_count
             
-            try:
-                self.workbook.save(fee_record_file_path)
-            except PermissionError as e:
-                return {
-                    "success": False,
-                    "error": f"Permission denied saving file. Please close Excel. Error: {str(e)}"
-                }
+            # Re-serialising the whole workbook is the slowest step - skip it
+            # when nothing in the sheet was touched
+            if self._sheet_modified(stats):
+                try:
+                    self._save_workbook(fee_record_file_path)
+                except PermissionError as e:
+                    return {
+                        "success": False,
+                        "error": f"Permission denied saving file. Please close Excel. Error: {str(e)}"
+                    }
             
             return {
                 "success": True,
                 "backup_path": backup_path,
                 "stats": stats,
-                "highlighting": self.get_highlighting_summary(),
-                "conflicts": self.get_conflict_summary()
+                # Summaries are only built if the caller actually reads them
+                "highlighting": _LazyDict(partial(self._summarize_highlights, self.updated_cells)),
+                "conflicts": _LazyDict(partial(self._summarize_conflicts, self.conflict_cells))
             }
             
         except Exception as e:
@@ -224,68 +395,169 @@ class FeeRecordManager:
                     self.workbook.close()
                 except:
                     pass
+            # Drop the in-memory cell graph so it doesn't outlive the load
+            self.workbook = None
+            self.worksheet = None
 
+    @staticmethod
+    def _sheet_modified(stats: Dict[str, int]) -> bool:
+        """Check whether processing changed any cell, fill or column"""
+        return any(stats.get(key, 0) for key in (
+            "cleared_cells", "new_months_created", "new_parents",
+            "highlighted_cells", "conflict_cells"
+        ))
+    
     def _create_backup(self, file_path: str) -> str:
-        """Create backup of original fee record file"""
+        """
+        Create backup of original fee record file
+        Uses a hardlink when possible - safe because _save_workbook never
+        rewrites the original file in place
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = f"{file_path}.backup_{timestamp}"
-        shutil.copy2(file_path, backup_path)
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            # Hardlinks unsupported (FAT, network shares, cross-volume).
+            # Contents only - the backup name already carries the timestamp
+            self._copy_file_contents(file_path, backup_path)
         return backup_path
     
+    @staticmethod
+    def _copy_file_contents(src: str, dst: str):
+        """
+        Copy file bytes, trying copy_file_range first - on Btrfs/XFS that
+        is a reflink and on network filesystems a server-side copy
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                        pass
+                return
+            except OSError:
+                # Unsupported here - the plain copy below overwrites any partial file
+                pass
+        
+        # Kernel fast path (sendfile / CopyFileEx)
+        shutil.copyfile(src, dst)
+    
+    def _save_workbook(self, file_path: str):
+        """
+        Save to a temporary file next to the target and swap it into place
+        
+        openpyxl writes directly into the target path, which would also
+        overwrite a hardlinked backup sharing the same file. A symlinked path
+        is resolved first so the link itself is kept
+        """
+        file_path = os.path.realpath(file_path)
+        temp_path = f"{file_path}.saving"
+        try:
+            self.workbook.save(temp_path)
+            if os.path.exists(file_path):
+                # The swapped-in file is new - keep the original's permission bits
+                shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
     def _is_file_locked(self, file_path: str) -> bool:
         """Check if file is locked or in use by another process"""
+        if os.name != 'nt':
+            # POSIX locks are advisory and never block opening the file, so
+            # the only thing an open could tell us is write permission
+            return not os.access(file_path, os.W_OK)
+        
         try:
-            with open(file_path, 'a'):
-                pass
-            return False
-        except IOError:
+            # Opening read/write without append fails while Excel holds the
+            # file open, and unlike open(..., 'a') never touches the file
+            fd = os.open(file_path, os.O_RDWR)
+        except OSError:
             return True
-        except Exception:
+        
+        try:
+            # Non-blocking probe for byte-range locks taken by other processes
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            return False
+        except OSError:
             return True
+        finally:
+            os.close(fd)
     
     def _analyze_fee_record_structure(self):
         """Dynamically analyze fee record file structure and build column mapping"""
         if not self.worksheet:
             raise Exception("Worksheet not loaded")
         
+        header_row = self._read_header_row(self.worksheet)
+        max_column = len(header_row)
+        
+        # Width of each merged range starting in row 1, keyed by its first column
+        merged_widths = {
+            merged_range.min_col: merged_range.max_col - merged_range.min_col + 1
+            for merged_range in self.worksheet.merged_cells.ranges
+            if merged_range.min_row == 1
+        }
+        
+        # Month headers merged over exactly 2 columns win; any other month
+        # header (first occurrence) is the non-merged fallback
+        merged_months = {}
+        fallback_months = {}
+        for col, header_value in enumerate(header_row, start=1):
+            if not header_value:
+                continue
+            
+            header_text = str(header_value).strip().upper()
+            if header_text not in self.MONTH_ORDER:
+                continue
+            
+            if merged_widths.get(col) == 2:
+                merged_months[header_text] = col
+            elif col + 1 <= max_column:
+                fallback_months.setdefault(header_text, col)
+        
         self.column_mapping = {}
-        merged_ranges = list(self.worksheet.merged_cells.ranges)
+        for month, start_col in {**fallback_months, **merged_months}.items():
+            self.column_mapping[month] = {
+                "merged_range": (start_col, start_col + 1),
+                "date_col": start_col,
+                "amount_col": start_col + 1
+            }
         
-        for merged_range in merged_ranges:
-            if merged_range.min_row <= 1 <= merged_range.max_row:
-                header_cell = self.worksheet.cell(row=1, column=merged_range.min_col)
-                header_value = header_cell.value
-                
-                if header_value:
-                    header_text = str(header_value).strip().upper()
-                    
-                    if header_text in self.MONTH_ORDER:
-                        start_col = merged_range.min_col
-                        end_col = merged_range.max_col
-                        
-                        if end_col - start_col + 1 == 2:
-                            self.column_mapping[header_text] = {
-                                "merged_range": (start_col, end_col),
-                                "date_col": start_col,
-                                "amount_col": start_col + 1
-                            }
-        
-        self._detect_non_merged_months()
-    
-    def _detect_non_merged_months(self):
-        """Detect non-merged month headers as fallback"""
-        for col in range(1, self.worksheet.max_column + 1):
-            header_cell = self.worksheet.cell(row=1, column=col)
-            if header_cell.value:
-                header_text = str(header_cell.value).strip().upper()
-                
-                if header_text in self.MONTH_ORDER and header_text not in self.column_mapping:
-                    if col + 1 <= self.worksheet.max_column:
-                        self.column_mapping[header_text] = {
-                            "merged_range": (col, col + 1),
-                            "date_col": col,
-                            "amount_col": col + 1
-                        }
+        self._date_cols = self._empty_month_cols()
+        self._amount_cols = self._empty_month_cols()
+        for month, mapping in self.column_mapping.items():
+            order = self.MONTH_ORDER[month]
+            self._date_cols[order] = mapping["date_col"]
+            self._amount_cols[order] = mapping["amount_col"]
+        self._refresh_month_order_index()
+        self._build_parent_row_index()
+    
+    def _build_parent_row_index(self):
+        """Index existing parent rows by upper-cased name in a single column pass"""
+        self._parent_row_index = {}
+        index_parent = self._parent_row_index.setdefault
+        parent_values = self.worksheet.iter_rows(
+            min_row=2, min_col=self.parent_column, max_col=self.parent_column, values_only=True
+        )
+        for row, (cell_value,) in enumerate(parent_values, start=2):
+            if cell_value:
+                # Keep the first match, as the old top-down scan did
+                index_parent(str(cell_value).strip().upper(), row)
+        self._next_parent_row = self.worksheet.max_row + 1
+    
+    @staticmethod
+    def _empty_month_cols() -> array:
+        """Column array with one slot per month ordinal (slot 0 unused)"""
+        return array('i', [0] * 13)
+    
+    @staticmethod
+    def _read_header_row(worksheet) -> Tuple[Any, ...]:
+        """Read all row 1 values in a single pass"""
+        return next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
     
     def _process_table_data_with_conflicts(self, table_data: List[List[str]]) -> Dict[str, int]:
         """Process all table data with enhanced conflict handling and statistics"""
@@ -303,39 +575,78 @@ class FeeRecordManager:
         
         self.updated_cells = []
         self.conflict_cells = []
+        self.new_parents_count = 0
+        
+        # Normalise rows and collect referenced months in one pass
+        prepared_rows, required_months = self._prepare_rows(table_data, stats)
         
         # Create missing months
-        required_months = set()
-        for row in table_data:
-            if len(row) >= 5 and row[4]:
-                month_3letter = row[4].strip()
-                if month_3letter in self.MONTH_MAPPING:
-                    required_months.add(self.MONTH_MAPPING[month_3letter])
-        
-        for month in required_months:
-            if month not in self.column_mapping:
-                self._create_month_column(month)
-                stats["new_months_created"] += 1
-                self._analyze_fee_record_structure()
+        missing_months = [month for month in required_months if month not in self.column_mapping]
+        if missing_months:
+            self._create_month_columns(missing_months)
+            stats["new_months_created"] += len(missing_months)
         
         # Process each row
-        for row_data in table_data:
+        process_row = self._process_single_row_with_conflicts
+        for row_data, parent_name, month_full, transaction_date, amount in prepared_rows:
             try:
-                result = self._process_single_row_with_conflicts(row_data)
+                result = process_row(parent_name, month_full, transaction_date, amount)
                 if result["updated"]:
                     stats["new_entries"] += result.get("new_entries", 0)
                     stats["appended_entries"] += result.get("appended_entries", 0)
                     stats["conflicts_resolved"] += result.get("conflicts", 0)
                 stats["processed_rows"] += 1
             except Exception as e:
-                print(f"Error processing row {row_data}: {e}")
+                _log.warning("Error processing row %s: %s", row_data, e)
                 stats["errors"] += 1
         
+        stats["new_parents"] = self.new_parents_count
         stats["highlighted_cells"] = len(self.updated_cells)
         stats["conflict_cells"] = len(self.conflict_cells)
         
         return stats
     
+    def _prepare_rows(self, table_data: List[List[str]],
+                      stats: Dict[str, int]) -> Tuple[List[Tuple[List[str], str, str, str, str]], Set[str]]:
+        """
+        Strip and validate every row once, collecting the months they reference
+        
+        Returns:
+            (rows to write as (row_data, parent, month_full, date, amount), required months)
+            Rows that are too short or lack a parent/known month are counted as
+            processed without producing a write, as before
+        """
+        month_full_for = self.MONTH_MAPPING.get
+        prepared_rows = []
+        required_months = set()
+        
+        for row_data in table_data:
+            try:
+                # Any row with a known month creates that month's column
+                month_full = None
+                if len(row_data) >= 5 and row_data[4]:
+                    month_full = month_full_for(row_data[4].strip())
+                    if month_full:
+                        required_months.add(month_full)
+                
+                if len(row_data) < 6 or not month_full:
+                    stats["processed_rows"] += 1
+                    continue
+                
+                parent_name = row_data[2].strip() if row_data[2] else ""
+                if not parent_name:
+                    stats["processed_rows"] += 1
+                    continue
+                
+                transaction_date = row_data[1].strip() if row_data[1] else ""
+                amount = row_data[5].strip() if row_data[5] else ""
+                prepared_rows.append((row_data, parent_name, month_full, transaction_date, amount))
+            except Exception as e:
+                _log.warning("Error processing row %s: %s", row_data, e)
+                stats["errors"] += 1
+        
+        return prepared_rows, required_months
+    
     def _is_cell_empty(self, cell) -> bool:
         """Check if a cell is empty or contains only whitespace"""
         if cell.value is None:
@@ -345,17 +656,18 @@ class FeeRecordManager:
     
     def _append_to_cell_simple(self, cell, new_value: str) -> bool:
         """Append new value to existing cell content with simple concatenation"""
-        if self._is_cell_empty(cell):
+        value = cell.value
+        existing_value = '' if value is None else str(value).strip()
+        if not existing_value:
             cell.value = new_value
             return False
         
-        existing_value = str(cell.value).strip()
-        combined_value = f"{existing_value}; {new_value}"
-        cell.value = combined_value
+        cell.value = f"{existing_value}; {new_value}"
         return True
     
-    def _process_single_row_with_conflicts(self, row_data: List[str]) -> Dict[str, Any]:
-        """Process a single row with enhanced conflict detection and handling"""
+    def _process_single_row_with_conflicts(self, parent_name: str, month_full: str,
+                                           transaction_date: str, amount: str) -> Dict[str, Any]:
+        """Process a single prepared row with enhanced conflict detection and handling"""
         result = {
             "updated": False,
             "new_entries": 0,
@@ -363,258 +675,314 @@ class FeeRecordManager:
             "conflicts": 0
         }
         
-        if len(row_data) < 6:
-            return result
+        # Rows are prepared with a known month and every referenced month's
+        # columns exist before writing starts, so no membership re-check here
+        month_order = self.MONTH_ORDER[month_full]
+        date_col = self._date_cols[month_order]
         
-        parent_name = row_data[2].strip() if row_data[2] else ""
-        month_3letter = row_data[4].strip() if row_data[4] else ""
-        transaction_date = row_data[1].strip() if row_data[1] else ""
-        amount = row_data[5].strip() if row_data[5] else ""
+        # Always write to the parent's exact row - no searching for empty rows
+        target_row = self._find_or_create_parent_row(parent_name)
         
-        if not all([parent_name, month_3letter]):
-            return result
-        
-        month_full = self.MONTH_MAPPING.get(month_3letter)
-        if not month_full or month_full not in self.column_mapping:
-            return result
-        
-        parent_row = self._find_or_create_parent_row(parent_name)
-        target_row = self._find_next_available_row_in_month(month_full, parent_row)
-        month_cols = self.column_mapping[month_full]
+        # Hot names bound once per row
+        amount_col = self._amount_cols[month_order]
+        ws_cell = self.worksheet.cell
+        apply_fill = self._apply_fill
+        conflict_fill = self.conflict_fill
+        highlight_fill = self.highlight_fill
+        conflict_cells_append = self.conflict_cells.append
+        updated_cells_append = self.updated_cells.append
         
         # Process date cell
-        if transaction_date and "date_col" in month_cols:
-            date_cell = self.worksheet.cell(row=target_row, column=month_cols["date_col"])
+        if transaction_date:
+            date_cell = ws_cell(row=target_row, column=date_col)
             had_conflict = self._append_to_cell_simple(date_cell, transaction_date)
             
             if had_conflict:
-                date_cell.fill = self.conflict_fill
+                apply_fill(date_cell, conflict_fill)
                 result["appended_entries"] += 1
                 result["conflicts"] += 1
-                self.conflict_cells.append({
-                    'row': target_row, 'col': month_cols["date_col"],
-                    'type': 'date_conflict', 'value': transaction_date,
-                    'parent': parent_name, 'month': month_full
-                })
+                conflict_cells_append((target_row, date_col, 'date_conflict', transaction_date,
+                                       parent_name, month_full))
             else:
-                date_cell.fill = self.highlight_fill
+                apply_fill(date_cell, highlight_fill)
                 result["new_entries"] += 1
-                self.updated_cells.append({
-                    'row': target_row, 'col': month_cols["date_col"],
-                    'type': 'date', 'value': transaction_date,
-                    'parent': parent_name, 'month': month_full
-                })
+                updated_cells_append((target_row, date_col, 'date', transaction_date,
+                                      parent_name, month_full))
         
         # Process amount cell - FIXED: Store as actual number with explicit format
-        if amount and "amount_col" in month_cols:
-            amount_cell = self.worksheet.cell(row=target_row, column=month_cols["amount_col"])
+        if amount:
+            amount_cell = ws_cell(row=target_row, column=amount_col)
+            value = amount_cell.value
+            existing_value = '' if value is None else str(value).strip()
             
             # Check if cell already has content (conflict handling)
-            if not self._is_cell_empty(amount_cell):
+            if existing_value:
                 # Conflict: append to existing content as text
                 formatted_amount = self._format_amount_smart(amount)
-                existing_value = str(amount_cell.value).strip()
                 combined_value = f"{existing_value}; {formatted_amount}"
                 amount_cell.value = combined_value
-                amount_cell.fill = self.conflict_fill
+                apply_fill(amount_cell, conflict_fill)
                 result["appended_entries"] += 1
                 result["conflicts"] += 1
-                self.conflict_cells.append({
-                    'row': target_row, 'col': month_cols["amount_col"],
-                    'type': 'amount_conflict', 'value': formatted_amount,
-                    'parent': parent_name, 'month': month_full
-                })
+                conflict_cells_append((target_row, amount_col, 'amount_conflict', formatted_amount,
+                                       parent_name, month_full))
             else:
                 # No conflict: store as actual number with explicit formatting
                 self._set_cell_value_as_number(amount_cell, amount)
-                amount_cell.fill = self.highlight_fill
+                apply_fill(amount_cell, highlight_fill)
                 result["new_entries"] += 1
-                self.updated_cells.append({
-                    'row': target_row, 'col': month_cols["amount_col"],
-                    'type': 'amount', 'value': str(amount_cell.value),
-                    'parent': parent_name, 'month': month_full
-                })
+                # Raw cell value; the summary stringifies it only if details are read
+                updated_cells_append((target_row, amount_col, 'amount', amount_cell.value,
+                                      parent_name, month_full))
         
         result["updated"] = True
         return result
     
-    def _create_month_column(self, month_name: str):
-        """Create new month column with merged header spanning 2 columns"""
-        insertion_col = self._find_month_insertion_point(month_name)
-        self.worksheet.insert_cols(insertion_col, 2)
+    def _create_month_columns(self, month_names: List[str]):
+        """
+        Create new month columns with merged headers spanning 2 columns
         
-        month_header_cell = self.worksheet.cell(row=1, column=insertion_col, value=month_name)
-        month_header_cell.font = Font(bold=True)
+        Positions are planned month by month on the column mapping first, then
+        the columns for every run of adjacent new months are opened up in one
+        pass over the sheet instead of shifting it once per month
+        """
+        for month_name in month_names:
+            insertion_col = self._find_month_insertion_point(month_name)
+            
+            # Shift existing months first so the new month itself is not shifted
+            self._shift_column_mappings_after_insertion(insertion_col, 2)
+            
+            self.column_mapping[month_name] = {
+                "merged_range": (insertion_col, insertion_col + 1),
+                "date_col": insertion_col,
+                "amount_col": insertion_col + 1
+            }
+            month_order = self.MONTH_ORDER[month_name]
+            self._date_cols[month_order] = insertion_col
+            self._amount_cols[month_order] = insertion_col + 1
+            self._refresh_month_order_index()
         
-        self.worksheet.merge_cells(
-            start_row=1, start_column=insertion_col,
-            end_row=1, end_column=insertion_col + 1
-        )
+        # Runs of adjacent new months as [final first column, month count]
+        runs = []
+        for date_col in sorted(self.column_mapping[month]["date_col"] for month in month_names):
+            if runs and runs[-1][0] + 2 * runs[-1][1] == date_col:
+                runs[-1][1] += 1
+            else:
+                runs.append([date_col, 1])
         
-        month_header_cell.alignment = Alignment(horizontal='center', vertical='center')
+        # A run's original column excludes the new columns of the runs before it
+        insertions = []
+        new_cols_before = 0
+        for first_col, count in runs:
+            insertions.append((first_col - new_cols_before, 2 * count))
+            new_cols_before += 2 * count
+        self._insert_columns(insertions)
         
-        self.column_mapping[month_name] = {
-            "merged_range": (insertion_col, insertion_col + 1),
-            "date_col": insertion_col,
-            "amount_col": insertion_col + 1
-        }
+        for month_name in month_names:
+            self._write_month_header(month_name, self.column_mapping[month_name]["date_col"])
+    
+    def _insert_columns(self, insertions: List[Tuple[int, int]]):
+        """
+        Insert blocks of columns, given as ascending (column, amount) pairs in
+        the current layout
+        
+        insert_cols leaves merged ranges in place, so they are re-created at
+        their shifted positions in one pass afterwards. The ranges hash on
+        their bounds, so the collection is replaced instead of moving them
+        inside it
+        """
+        # Right to left, so the columns of the blocks still to insert are unchanged
+        for col, amount in reversed(insertions):
+            self.worksheet.insert_cols(col, amount)
         
-        self._shift_column_mappings_after_insertion(insertion_col, 2)
+        insert_cols = [col for col, _ in insertions]
+        offsets = []
+        total = 0
+        for _, amount in insertions:
+            total += amount
+            offsets.append(total)
+        
+        def offset_of(col: int) -> int:
+            # Columns inserted at or left of col
+            blocks = bisect.bisect_right(insert_cols, col)
+            return offsets[blocks - 1] if blocks else 0
+        
+        shifted_ranges = []
+        for merged_range in self.worksheet.merged_cells.ranges:
+            coord = CellRange(
+                min_col=merged_range.min_col + offset_of(merged_range.min_col),
+                min_row=merged_range.min_row,
+                max_col=merged_range.max_col + offset_of(merged_range.max_col),
+                max_row=merged_range.max_row
+            ).coord
+            shifted_ranges.append(MergedCellRange(self.worksheet, coord))
+        self.worksheet.merged_cells = MultiCellRange(shifted_ranges)
+    
+    def _write_month_header(self, month_name: str, date_col: int):
+        """Write a month header merged over its date and amount columns"""
+        month_header_cell = self.worksheet.cell(row=1, column=date_col, value=month_name)
+        month_header_cell.font = self._BOLD_FONT
+        
+        self.worksheet.merge_cells(
+            start_row=1, start_column=date_col,
+            end_row=1, end_column=date_col + 1
+        )
+        
+        month_header_cell.alignment = self._HEADER_ALIGNMENT
+    
+    def _refresh_month_order_index(self):
+        """Rebuild the order-sorted month index used by _find_month_insertion_point"""
+        self._month_orders = []
+        self._month_prefix_min_cols = []
+        leftmost_col = None
+        # The column arrays are already in month order
+        for order, date_col in enumerate(self._date_cols):
+            if not date_col:
+                continue
+            leftmost_col = date_col if leftmost_col is None else min(leftmost_col, date_col)
+            self._month_orders.append(order)
+            self._month_prefix_min_cols.append(leftmost_col)
     
     def _find_month_insertion_point(self, month_name: str) -> int:
         """Find where to insert new month column based on reverse chronological order"""
         target_order = self.MONTH_ORDER.get(month_name, 0)
         
-        if not self.column_mapping:
+        if not self._month_prefix_min_cols:
             return self.parent_column + 1
         
-        insertion_point = None
-        leftmost_col = float('inf')
-        
-        for existing_month, mapping in self.column_mapping.items():
-            existing_order = self.MONTH_ORDER.get(existing_month, 0)
-            
-            if target_order > existing_order:
-                if mapping["date_col"] < leftmost_col:
-                    leftmost_col = mapping["date_col"]
-                    insertion_point = mapping["date_col"]
-        
-        if insertion_point is None:
-            leftmost_col = float('inf')
-            for mapping in self.column_mapping.values():
-                leftmost_col = min(leftmost_col, mapping["date_col"])
-            
-            insertion_point = leftmost_col if leftmost_col != float('inf') else self.parent_column + 1
-        
-        return insertion_point
+        # Leftmost column among earlier months; if none are earlier, leftmost of all
+        earlier_count = bisect.bisect_left(self._month_orders, target_order)
+        if earlier_count:
+            return self._month_prefix_min_cols[earlier_count - 1]
+        return self._month_prefix_min_cols[-1]
     
     def _shift_column_mappings_after_insertion(self, insertion_col: int, cols_inserted: int):
         """Update existing column mappings after inserting new columns"""
-        for month, mapping in self.column_mapping.items():
-            if mapping["date_col"] >= insertion_col:
-                old_start, old_end = mapping["merged_range"]
-                mapping["merged_range"] = (old_start + cols_inserted, old_end + cols_inserted)
-                mapping["date_col"] += cols_inserted
-                mapping["amount_col"] += cols_inserted
+        date_cols = self._date_cols
+        amount_cols = self._amount_cols
+        for order, date_col in enumerate(date_cols):
+            # Empty slots are 0, always left of any insertion point
+            if date_col < insertion_col:
+                continue
+            
+            date_cols[order] = date_col + cols_inserted
+            amount_cols[order] += cols_inserted
+            
+            mapping = self.column_mapping[self.MONTH_BY_ORDER[order]]
+            old_start, old_end = mapping["merged_range"]
+            mapping["merged_range"] = (old_start + cols_inserted, old_end + cols_inserted)
+            mapping["date_col"] = date_cols[order]
+            mapping["amount_col"] = amount_cols[order]
     
     def _find_or_create_parent_row(self, parent_name: str) -> int:
         """Find existing parent row or create new one"""
-        for row in range(2, self.worksheet.max_row + 1):
-            cell_value = self.worksheet.cell(row=row, column=self.parent_column).value
-            if cell_value and str(cell_value).strip().upper() == parent_name.upper():
-                return row
+        parent_key = parent_name.upper()
+        row = self._parent_row_index.get(parent_key)
+        if row is not None:
+            return row
         
-        new_row = self.worksheet.max_row + 1
+        new_row = self._next_parent_row
+        self._next_parent_row += 1
         parent_cell = self.worksheet.cell(row=new_row, column=self.parent_column, value=parent_name)
-        parent_cell.fill = self.new_parent_fill
+        self._apply_fill(parent_cell, self.new_parent_fill)
+        self._parent_row_index[parent_key] = new_row
+        self.new_parents_count += 1
         return new_row
     
-    def _find_next_available_row_in_month(self, month_name: str, preferred_row: int) -> int:
-        """Always use the parent's exact row - no searching for empty rows"""
-        return preferred_row
-    
     def get_conflict_summary(self) -> Dict[str, Any]:
         """Get summary of conflicts for user feedback"""
-        if not self.conflict_cells:
+        return self._summarize_conflicts(self.conflict_cells)
+    
+    @staticmethod
+    def _summarize_conflicts(conflict_cells: List[Tuple]) -> Dict[str, Any]:
+        if not conflict_cells:
             return {"total_conflicts": 0, "by_type": {}, "by_parent": {}, "by_month": {}}
         
         by_type = {"date_conflict": 0, "amount_conflict": 0}
-        by_parent = {}
-        by_month = {}
-        
-        for conflict_info in self.conflict_cells:
-            conflict_type = conflict_info['type']
-            by_type[conflict_type] = by_type.get(conflict_type, 0) + 1
-            
-            parent = conflict_info['parent']
-            by_parent[parent] = by_parent.get(parent, 0) + 1
-            
-            month = conflict_info['month']
-            by_month[month] = by_month.get(month, 0) + 1
+        # Transpose the records into per-field columns so Counter runs in C
+        _, _, types, _, parents, months = zip(*conflict_cells)
+        by_type.update(Counter(types))
+        by_parent = dict(Counter(parents))
+        by_month = dict(Counter(months))
         
         return {
-            "total_conflicts": len(self.conflict_cells),
+            "total_conflicts": len(conflict_cells),
             "by_type": by_type,
             "by_parent": by_parent,
             "by_month": by_month,
-            "details": self.conflict_cells
+            "details": [dict(zip(_CELL_RECORD_FIELDS, c)) for c in conflict_cells]
         }
     
     def get_highlighting_summary(self) -> Dict[str, Any]:
         """Get summary of highlighted cells for user feedback"""
-        if not self.updated_cells:
+        return self._summarize_highlights(self.updated_cells)
+    
+    @staticmethod
+    def _summarize_highlights(updated_cells: List[Tuple]) -> Dict[str, Any]:
+        if not updated_cells:
             return {"total_highlighted": 0, "by_type": {}, "by_parent": {}, "by_month": {}}
         
         by_type = {"date": 0, "amount": 0}
-        by_parent = {}
-        by_month = {}
-        
-        for cell_info in self.updated_cells:
-            cell_type = cell_info['type']
-            by_type[cell_type] = by_type.get(cell_type, 0) + 1
-            
-            parent = cell_info['parent']
-            by_parent[parent] = by_parent.get(parent, 0) + 1
-            
-            month = cell_info['month']
-            by_month[month] = by_month.get(month, 0) + 1
+        # Transpose the records into per-field columns so Counter runs in C
+        _, _, types, _, parents, months = zip(*updated_cells)
+        by_type.update(Counter(types))
+        by_parent = dict(Counter(parents))
+        by_month = dict(Counter(months))
         
         return {
-            "total_highlighted": len(self.updated_cells),
+            "total_highlighted": len(updated_cells),
             "by_type": by_type,
             "by_parent": by_parent,
             "by_month": by_month,
-            "details": self.updated_cells
+            "details": [
+                {'row': row, 'col': col, 'type': cell_type, 'value': str(value),
+                 'parent': parent, 'month': month}
+                for row, col, cell_type, value, parent, month in updated_cells
+            ]
         }
     
     def preview_changes(self, table_data: List[List[str]], fee_record_file_path: str) -> Dict[str, Any]:
         """Preview what changes will be made without actually modifying the file"""
         try:
-            temp_workbook = openpyxl.load_workbook(fee_record_file_path)
-            temp_worksheet = temp_workbook.active
-            
-            preview_info = {
-                "total_rows": len(table_data),
-                "new_months": [],
-                "affected_parents": set(),
-                "potential_conflicts": 0
-            }
+            # Keyed on mtime and size, so reopening the preview for an unchanged
+            # file skips the parse while any save invalidates it
+            file_stat = os.stat(fee_record_file_path)
+            header_row = _read_file_header_row(fee_record_file_path, file_stat.st_mtime_ns,
+                                               file_stat.st_size)
             
+            # Merged month headers keep their value in the first cell, so one
+            # row 1 scan finds both merged and non-merged months
             existing_months = set()
-            
-            if hasattr(temp_worksheet, 'merged_cells'):
-                merged_ranges = list(temp_worksheet.merged_cells.ranges)
-                
-                for merged_range in merged_ranges:
-                    if merged_range.min_row <= 1 <= merged_range.max_row:
-                        header_cell = temp_worksheet.cell(row=1, column=merged_range.min_col)
-                        if header_cell.value:
-                            header_text = str(header_cell.value).strip().upper()
-                            if header_text in self.MONTH_ORDER:
-                                existing_months.add(header_text)
-            
-            for col in range(1, temp_worksheet.max_column + 1):
-                header_cell = temp_worksheet.cell(row=1, column=col)
-                if header_cell.value:
-                    header_text = str(header_cell.value).strip().upper()
+            for header_value in header_row:
+                if header_value:
+                    header_text = str(header_value).strip().upper()
                     if header_text in self.MONTH_ORDER:
                         existing_months.add(header_text)
             
+            # Single pass collecting new months and affected parents straight into sets
+            month_full_for = self.MONTH_MAPPING.get
+            new_months = set()
+            affected_parents = set()
             for row in table_data:
-                if len(row) >= 5 and row[4]:
-                    month_3letter = row[4].strip()
-                    if month_3letter in self.MONTH_MAPPING:
-                        month_full = self.MONTH_MAPPING[month_3letter]
-                        if month_full not in existing_months:
-                            preview_info["new_months"].append(month_full)
-                        
-                        if len(row) >= 3 and row[2]:
-                            preview_info["affected_parents"].add(row[2].strip())
-            
-            preview_info["new_months"] = list(set(preview_info["new_months"]))
-            preview_info["affected_parents"] = list(preview_info["affected_parents"])
-            
-            temp_workbook.close()
+                if len(row) < 5 or not row[4]:
+                    continue
+                
+                month_full = month_full_for(row[4].strip())
+                if not month_full:
+                    continue
+                
+                if month_full not in existing_months:
+                    new_months.add(month_full)
+                if row[2]:
+                    affected_parents.add(row[2].strip())
+            
+            preview_info = {
+                "total_rows": len(table_data),
+                "new_months": list(new_months),
+                "affected_parents": list(affected_parents),
+                "potential_conflicts": 0
+            }
+            
             return preview_info
             
         except Exception as e:
@@ -628,25 +996,48 @@ class FeeRecordManager:
             errors.append("No data to validate")
             return errors
         
-        for i, row in enumerate(table_data):
+        # Vectorised checks over whole columns; Python only touches flagged rows
+        df = pd.DataFrame(table_data).reindex(columns=range(6))
+        short_row = np.fromiter((len(row) < 6 for row in table_data), dtype=bool, count=len(table_data))
+        
+        def stripped(col: int) -> pd.Series:
+            return df[col].fillna('').astype(str).str.strip()
+        
+        parents = stripped(2)
+        months = stripped(4)
+        amounts = df[5].fillna('').astype(str)
+        
+        # Plain boolean arrays - indexing a Series per flagged row is slow
+        full_row = ~short_row
+        missing_parent = full_row & parents.eq('').to_numpy()
+        missing_month = full_row & months.eq('').to_numpy()
+        invalid_month = full_row & ~missing_month & ~months.isin(self.MONTH_MAPPING).to_numpy()
+        parsed_amounts = pd.to_numeric(amounts.str.replace(_AMOUNT_STRIP_RE, '', regex=True), errors='coerce')
+        bad_amount = full_row & amounts.str.strip().ne('').to_numpy() & parsed_amounts.isna().to_numpy()
+        
+        flagged = short_row | missing_parent | missing_month | invalid_month | bad_amount
+        
+        for i in np.flatnonzero(flagged).tolist():
+            row = table_data[i]
             row_num = i + 1
             
-            if len(row) < 6:
+            if short_row[i]:
                 errors.append(f"Row {row_num}: Missing columns (expected 6)")
                 continue
             
-            if not row[2] or not row[2].strip():
+            if missing_parent[i]:
                 errors.append(f"Row {row_num}: Missing parent name")
             
-            if not row[4] or not row[4].strip():
+            if missing_month[i]:
                 errors.append(f"Row {row_num}: Missing month")
-            elif row[4].strip() not in self.MONTH_MAPPING:
+            elif invalid_month[i]:
                 errors.append(f"Row {row_num}: Invalid month {row[4]}")
             
-            if row[5] and row[5].strip():
+            if bad_amount[i]:
+                # to_numeric rejects a few spellings float() accepts ('nan', '1_000')
                 try:
-                    float(row[5].replace(',', '').replace('$', '').replace('RM', ''))
+                    float(_strip_amount_symbols(row[5]))
                 except ValueError:
                     errors.append(f"Row {row_num}: Invalid amount format {row[5]}")
         
-        return errors
\ No newline at end of file
+        return errors
@@ -3,9 +3,13 @@ Core processing logic for fee matching
 Handles the main business logic for matching transaction data to fee records
 """
 import csv
+import numpy as np
 import pandas as pd
 from matchers import ParentMatcher, ChildMatcher, MonthMatcher
 
+# Transaction file columns holding the payment reference text
+REFERENCE_COLUMN_INDEXES = (5, 6, 7, 8)
+
 
 def process_fee_matching_gui(fee_record_file, transaction_file):
     """
@@ -53,29 +57,13 @@ def process_fee_matching_gui(fee_record_file, transaction_file):
 
 def _read_transaction_file(transaction_file):
     """Read and normalize transaction CSV file"""
-    all_rows = []
+    # Single pass: drop completely empty rows while reading
     with open(transaction_file, 'r', encoding='utf-8', newline='') as f:
-        csv_reader = csv.reader(f)
-        for row_num, row in enumerate(csv_reader):
-            all_rows.append(row)
-    
-    # Remove completely empty rows
-    filtered_rows = []
-    for row in all_rows:
-        if any(str(cell).strip() for cell in row):
-            filtered_rows.append(row)
-    
-    # Normalize row lengths
-    max_cols = max(len(row) for row in filtered_rows) if filtered_rows else 0
-    padded_rows = []
-    for row in filtered_rows:
-        padded_row = row + [''] * (max_cols - len(row))
-        padded_rows.append(padded_row)
-    
-    # Create DataFrame
-    columns = [f'Col_{i}' for i in range(max_cols)]
-    trans_df = pd.DataFrame(padded_rows, columns=columns)
-    trans_df.reset_index(drop=True, inplace=True)
+        rows = [row for row in csv.reader(f) if any(cell.strip() for cell in row)]
+    
+    # The DataFrame constructor pads ragged rows in C; fill the gaps with ''
+    trans_df = pd.DataFrame(rows).fillna('')
+    trans_df.columns = [f'Col_{i}' for i in range(len(trans_df.columns))]
     
     return trans_df
 
@@ -83,90 +71,157 @@ def _read_transaction_file(transaction_file):
 def _process_transactions(trans_df, fee_df, parent_matcher, child_matcher, month_matcher, parent_names):
     """Process each transaction row and perform matching"""
     all_results = []
+    matched_results = []
+    parent_matches, child_matches, month_matches = [], [], []
     
-    for idx, row in trans_df.iterrows():
-        # Extract transaction data
-        transaction_date = _extract_transaction_date(row, trans_df.columns)
-        reference_columns = _extract_reference_columns(row, trans_df.columns)
-        amount = _extract_amount(row, trans_df.columns)
-        
-        # Skip if no meaningful transaction reference
-        if not any(ref.strip() for ref in reference_columns):
-            continue
-        
+    # Rows without any reference text produce no result - drop them up front
+    references, non_blank = _extract_reference_cells(trans_df)
+    has_reference = non_blank.any(axis=1).to_numpy()
+    trans_df = trans_df[has_reference]
+    
+    amounts = _extract_amounts(trans_df)
+    # "not <= 0" rather than "> 0" so NaN amounts still reach the matchers
+    needs_matching = ~(np.array(amounts, dtype=np.float64) <= 0)
+    
+    # Extract transaction data column-wise up front - iterrows builds a Series per row
+    rows = zip(
+        trans_df.index.tolist(),
+        _extract_transaction_dates(trans_df),
+        _extract_reference_columns(references[has_reference], non_blank[has_reference]),
+        amounts,
+        needs_matching.tolist()
+    )
+    
+    for idx, transaction_date, reference_columns, amount, is_valid in rows:
         # Skip if no valid amount
-        if amount <= 0:
+        if not is_valid:
             all_results.append(_create_empty_result(idx, "", "", 0))
             continue
         
-        # Create display reference
-        transaction_ref = " | ".join(ref for ref in reference_columns if ref.strip())
+        # Create display reference (blank references are already dropped)
+        transaction_ref = " | ".join(reference_columns)
         
         # Perform matching
         best_parent_match, parent_score = parent_matcher.match(reference_columns, parent_names)
         best_child_match, child_score = child_matcher.match(reference_columns, fee_df, best_parent_match)
         extracted_month, month_score = month_matcher.match(reference_columns, transaction_date)
         
-        # Create result
+        # Create result - display names are filled in column-wise after the loop
         has_match = best_parent_match or best_child_match
         result = {
             'index': idx,
             'parent_from_transaction': transaction_ref,
             'transaction_date': transaction_date,
-            'matched_parent': best_parent_match.strip() if best_parent_match else "NO MATCH FOUND",
-            'matched_child': best_child_match.strip() if best_child_match else "NO CHILD MATCH FOUND",
-            'month_paying_for': extracted_month if extracted_month else "NO MONTH FOUND",
+            'matched_parent': None,
+            'matched_child': None,
+            'month_paying_for': None,
             'amount': amount,
             'matched': has_match
         }
         
         all_results.append(result)
+        matched_results.append(result)
+        parent_matches.append(best_parent_match)
+        child_matches.append(best_child_match)
+        month_matches.append(extracted_month)
+    
+    display_columns = zip(
+        _display_names(parent_matches, "NO MATCH FOUND"),
+        _display_names(child_matches, "NO CHILD MATCH FOUND"),
+        _display_names(month_matches, "NO MONTH FOUND", strip=False)
+    )
+    for result, (parent, child, month) in zip(matched_results, display_columns):
+        result['matched_parent'] = parent
+        result['matched_child'] = child
+        result['month_paying_for'] = month
     
     return all_results
 
 
-def _extract_transaction_date(row, columns):
-    """Extract transaction date from first column"""
-    if len(columns) > 0:
-        date_val = row['Col_0']
-        if pd.notna(date_val) and str(date_val).strip():
-            raw_date = str(date_val).strip()
-            # Clean Excel formatting
-            if raw_date.startswith('="'):
-                raw_date = raw_date[2:]
-            if raw_date.endswith('"'):
-                raw_date = raw_date[:-1]
-            # Skip header rows
-            if raw_date == "Trn. Date":
-                return ""
-            return raw_date
-    return ""
-
-
-def _extract_reference_columns(row, columns):
-    """Extract reference data from columns 5-8"""
-    reference_columns = []
-    for col_idx in [5, 6, 7, 8]:
-        if len(columns) > col_idx:
-            col_name = f'Col_{col_idx}'
-            col_val = row[col_name]
-            if pd.notna(col_val) and str(col_val).strip():
-                reference_columns.append(str(col_val))
-    return reference_columns
-
-
-def _extract_amount(row, columns):
-    """Extract amount from column 4"""
-    if len(columns) > 4:
-        col_4_val = row['Col_4']
-        if pd.notna(col_4_val) and str(col_4_val).strip():
-            amount_str = str(col_4_val)
-            try:
-                amount_str = amount_str.replace(',', '').replace('$', '').replace('RM', '').strip()
-                if amount_str and amount_str != 'nan':
-                    return float(amount_str)
-            except (ValueError, AttributeError):
-                pass
+def _display_names(names, fallback, strip=True):
+    """Return display strings for matcher results, using fallback where nothing matched"""
+    names = pd.Series(names, dtype=object)
+    found = names.astype(bool)
+    if strip:
+        names = names.where(~found, names[found].str.strip())
+    return names.where(found, fallback).tolist()
+
+
+def _extract_transaction_dates(trans_df):
+    """Extract transaction dates from the first column for every row"""
+    if 'Col_0' not in trans_df.columns:
+        return [""] * len(trans_df)
+    
+    raw_dates = trans_df['Col_0'].fillna('').astype(str).str.strip()
+    # Clean Excel formatting
+    raw_dates = raw_dates.str.removeprefix('="').str.removesuffix('"')
+    # Skip header rows
+    raw_dates = raw_dates.where(raw_dates != "Trn. Date", "")
+    return raw_dates.tolist()
+
+
+def _extract_reference_cells(trans_df):
+    """Return the reference cells from columns 5-8 and a mask of the non-blank ones"""
+    col_names = [f'Col_{col_idx}' for col_idx in REFERENCE_COLUMN_INDEXES
+                 if f'Col_{col_idx}' in trans_df.columns]
+    references = trans_df[col_names].fillna('').astype(str)
+    non_blank = pd.DataFrame(
+        {col: references[col].str.strip() != '' for col in col_names},
+        index=references.index, dtype=bool
+    )
+    return references, non_blank
+
+
+def _extract_reference_columns(references, non_blank):
+    """Extract reference data for every row, dropping blank cells"""
+    return [
+        [ref for ref, keep in zip(row_refs, row_keep) if keep]
+        for row_refs, row_keep in zip(references.to_numpy().tolist(), non_blank.to_numpy().tolist())
+    ]
+
+
+def _extract_amounts(trans_df):
+    """
+    Extract amounts from column 4 for every row - same values as _extract_amount
+    
+    The cleanup runs column-wise. to_numeric only picks out the rows that parse
+    directly; those are converted with float() semantics so values match exactly,
+    and the rest ('', 'nan', '1_000', ...) go through _extract_amount
+    """
+    if 'Col_4' not in trans_df.columns:
+        return [0] * len(trans_df)
+    
+    raw_amounts = trans_df['Col_4']
+    cleaned = (raw_amounts.fillna('').astype(str)
+               .str.replace(',', '', regex=False)
+               .str.replace('$', '', regex=False)
+               .str.replace('RM', '', regex=False)
+               .str.strip())
+    parseable = pd.to_numeric(cleaned, errors='coerce').notna().to_numpy()
+    
+    try:
+        parsed = cleaned.to_numpy(dtype=object)[parseable].astype(np.float64).tolist()
+    except ValueError:
+        # to_numeric accepted a spelling float() rejects - parse row by row
+        return [_extract_amount(val) for val in raw_amounts.tolist()]
+    
+    parsed_amounts = iter(parsed)
+    return [
+        next(parsed_amounts) if is_parseable else _extract_amount(val)
+        for is_parseable, val in zip(parseable.tolist(), raw_amounts.tolist())
+    ]
+
+
+def _extract_amount(col_4_val):
+    """Extract amount from column 4 value"""
+    if pd.notna(col_4_val) and str(col_4_val).strip():
+        amount_str = str(col_4_val)
+        try:
+            amount_str = amount_str.replace(',', '').replace('$', '').replace('RM', '').strip()
+            if amount_str and amount_str != 'nan':
+                return float(amount_str)
+        except (ValueError, AttributeError):
+            pass
     return 0
 
 
@@ -4,10 +4,14 @@ Handles data storage, manipulation, and basic operations without validation
 """
 import json
 import copy
+from collections import Counter
+from itertools import islice
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from PyQt5.QtCore import QObject, pyqtSignal
 
+from gui.validation_tracker import ValidationTracker
+
 
 class TableDataManager(QObject):
     """Core data manager for table operations"""
@@ -24,29 +28,165 @@ class TableDataManager(QObject):
         self.current_data = []   # Current table data
         self.column_headers = []
         
-        # Change tracking
-        self.modified_cells = {}  # {(row, col): {'old': value, 'new': value}}
-        self.new_rows = {}        # {row_index: [values]}
+        # Row ids - stable across inserts/deletes, parallel to current_data
+        self._row_ids = []
+        self._next_row_id = 0
+        
+        # Row lengths of current_data, so the narrowest row is known without a scan
+        self._row_widths = Counter()  # {row_length: row_count}
+        
+        # Change tracking, keyed by row id (see the modified_cells/new_rows properties)
+        self._cell_changes = {}   # {row_id: {col: {'old': value, 'new': value}}}
+        self._new_row_values = {} # {row_id: [values]}
         self.deleted_rows = {}    # {original_row_index: [original_values]}
         
-        # Undo/redo stacks
+        # Undo/redo stacks - each entry is a journal of the changes that revert one
+        # undo point, e.g. ('cell', row, col, old_value, old_change) or ('remove', row)
         self.undo_stack = []
         self.redo_stack = []
         self.max_undo_levels = 50
         
+        # Cell validator - created once, its rules are fixed
+        self._validator = ValidationTracker()
+        
     def set_original_data(self, data: List[List[Any]], headers: List[str]):
         """Set the original data from processing results"""
         self.original_data = copy.deepcopy(data)
         self.current_data = copy.deepcopy(data)
         self.column_headers = headers.copy()
+        self._reset_row_ids()
+        self._count_row_widths()
         
         # Clear change tracking
         self.clear_change_tracking()
         
+    @property
+    def modified_cells(self) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        """Modified cells keyed by current position: {(row, col): {'old': value, 'new': value}}"""
+        return {
+            (row, col): change
+            for row, row_id in enumerate(self._row_ids) if row_id in self._cell_changes
+            for col, change in self._cell_changes[row_id].items()
+        }
+        
+    @property
+    def new_rows(self) -> Dict[int, List[Any]]:
+        """New rows keyed by current position: {row_index: [values]}"""
+        return {
+            row: self._new_row_values[row_id]
+            for row, row_id in enumerate(self._row_ids) if row_id in self._new_row_values
+        }
+        
+    def _reset_row_ids(self):
+        """Give every row of current_data a fresh id"""
+        self._row_ids = []
+        self._append_row_ids(len(self.current_data))
+        
+    def _append_row_ids(self, count: int):
+        """Assign ids to rows appended to current_data"""
+        self._row_ids.extend(range(self._next_row_id, self._next_row_id + count))
+        self._next_row_id += count
+        
+    def _count_row_widths(self):
+        """Recount the row lengths of current_data"""
+        self._row_widths = Counter(len(row) for row in self.current_data)
+        
+    def _change_row_width_count(self, width: int, delta: int):
+        """Add or remove one row of the given length from the row length counts"""
+        self._row_widths[width] += delta
+        if not self._row_widths[width]:
+            del self._row_widths[width]
+            
+    def _min_row_width(self) -> int:
+        """Length of the narrowest row in current_data (0 when empty)"""
+        return min(self._row_widths, default=0)
+        
+    def _get_cell_change(self, row_id: int, col: int) -> Optional[Dict[str, Any]]:
+        """Get the tracked change of a cell, or None"""
+        return self._cell_changes.get(row_id, {}).get(col)
+        
+    def _set_cell_change(self, row_id: int, col: int, change: Optional[Dict[str, Any]]):
+        """Set the tracked change of a cell; None removes it"""
+        if change is not None:
+            self._cell_changes.setdefault(row_id, {})[col] = change
+        elif col in self._cell_changes.get(row_id, {}):
+            row_changes = self._cell_changes[row_id]
+            del row_changes[col]
+            if not row_changes:
+                del self._cell_changes[row_id]
+                
+    def _shift_cell_change_columns(self, col_index: int, shift: int):
+        """Move tracked cell changes right of an inserted (+1) or deleted (-1) column"""
+        for row_id in list(self._cell_changes):
+            row_changes = {
+                col + shift if col >= col_index else col: change
+                for col, change in self._cell_changes[row_id].items()
+                if shift > 0 or col != col_index
+            }
+            if row_changes:
+                self._cell_changes[row_id] = row_changes
+            else:
+                del self._cell_changes[row_id]
+                
+    def _detach_row(self, row_index: int) -> Tuple:
+        """Remove a row with its tracking; returns what _attach_row needs to put it back"""
+        row_id = self._row_ids.pop(row_index)
+        self._change_row_width_count(len(self.current_data[row_index]), -1)
+        return (row_id, self.current_data.pop(row_index),
+                self._new_row_values.pop(row_id, None), self._cell_changes.pop(row_id, None))
+        
+    def _attach_row(self, row_index: int, row_id: int, row_data: List[Any],
+                    new_values: Optional[List[Any]], cell_changes: Optional[Dict[int, Dict[str, Any]]]):
+        """Insert a row with its tracking, as returned by _detach_row"""
+        self._row_ids.insert(row_index, row_id)
+        self.current_data.insert(row_index, row_data)
+        self._change_row_width_count(len(row_data), 1)
+        if new_values is not None:
+            self._new_row_values[row_id] = new_values
+        if cell_changes is not None:
+            self._cell_changes[row_id] = cell_changes
+            
+    def _detach_rows(self, row_indices: List[int]) -> List[Tuple]:
+        """Remove rows (sorted indices) in one pass; returns what _attach_rows needs to put them back"""
+        detached = []
+        for row_index in row_indices:
+            row_id = self._row_ids[row_index]
+            self._change_row_width_count(len(self.current_data[row_index]), -1)
+            detached.append((row_index, row_id, self.current_data[row_index],
+                             self._new_row_values.pop(row_id, None), self._cell_changes.pop(row_id, None)))
+            
+        drop = set(row_indices)
+        self.current_data[:] = [row for i, row in enumerate(self.current_data) if i not in drop]
+        self._row_ids = [row_id for i, row_id in enumerate(self._row_ids) if i not in drop]
+        return detached
+        
+    def _attach_rows(self, detached: List[Tuple]):
+        """Insert rows with their tracking in one pass, as returned by _detach_rows"""
+        data, row_ids = [], []
+        kept_rows = zip(self._row_ids, self.current_data)
+        for row_index, row_id, row_data, new_values, cell_changes in detached:
+            # Fill in the kept rows that come before this one
+            for kept_id, kept_row in islice(kept_rows, row_index - len(row_ids)):
+                row_ids.append(kept_id)
+                data.append(kept_row)
+            row_ids.append(row_id)
+            data.append(row_data)
+            self._change_row_width_count(len(row_data), 1)
+            if new_values is not None:
+                self._new_row_values[row_id] = new_values
+            if cell_changes is not None:
+                self._cell_changes[row_id] = cell_changes
+                
+        for kept_id, kept_row in kept_rows:
+            row_ids.append(kept_id)
+            data.append(kept_row)
+        self._row_ids = row_ids
+        self.current_data[:] = data
+        
     def clear_change_tracking(self):
         """Clear all change tracking"""
-        self.modified_cells.clear()
-        self.new_rows.clear()
+        self._cell_changes.clear()
+        self._new_row_values.clear()
         self.deleted_rows.clear()
         self.undo_stack.clear()
         self.redo_stack.clear()
@@ -57,17 +197,24 @@ class TableDataManager(QObject):
             self.create_undo_point()
             
         # Get old value
-        if row < len(self.current_data) and col < len(self.current_data[row]):
+        in_bounds = row < len(self.current_data) and col < len(self.current_data[row])
+        if in_bounds:
             old_value = self.current_data[row][col]
         else:
             old_value = ""
             
         # Validate new value using validation tracker
-        from gui.validation_tracker import ValidationTracker
-        validator = ValidationTracker()
-        if not validator.validate_cell_value(row, col, new_value):
+        if not self._validator.validate_cell_value(row, col, new_value):
             return False
             
+        # ensure_data_size pads every short row, not just this one
+        if in_bounds and col < self._min_row_width():
+            self._record_change(('cell', row, col, old_value,
+                                 self._get_cell_change(self._row_ids[row], col)))
+        else:
+            # Growing the table touches other rows - fall back to a full snapshot
+            self._record_snapshot()
+            
         # Ensure current_data has enough rows/cols
         self.ensure_data_size(row + 1, col + 1)
         
@@ -75,20 +222,21 @@ class TableDataManager(QObject):
         self.current_data[row][col] = new_value
         
         # Track the change if it's not a new row
-        if row not in self.new_rows:
+        row_id = self._row_ids[row]
+        if row_id not in self._new_row_values:
             # Get original value for comparison
             original_value = ""
             if row < len(self.original_data) and col < len(self.original_data[row]):
                 original_value = self.original_data[row][col]
                 
             if str(new_value) != str(original_value):
-                self.modified_cells[(row, col)] = {
+                self._set_cell_change(row_id, col, {
                     'old': original_value,
                     'new': new_value
-                }
+                })
             else:
                 # Value reverted to original, remove from modified tracking
-                self.modified_cells.pop((row, col), None)
+                self._set_cell_change(row_id, col, None)
                 
         return True
         
@@ -104,14 +252,12 @@ class TableDataManager(QObject):
         while len(values) < len(self.column_headers):
             values.append("")
             
-        # Insert into current data
-        self.current_data.insert(row_index, values)
-        
-        # Track as new row
-        self.new_rows[row_index] = values.copy()
-        
-        # Update indices in tracking dictionaries
-        self.update_indices_after_insert(row_index)
+        # Insert into current data and track as new row - tracking is keyed by
+        # row id, so no other entries need shifting
+        row_index = min(row_index, len(self.current_data))
+        self._attach_row(row_index, self._next_row_id, values, values.copy(), None)
+        self._next_row_id += 1
+        self._record_change(('remove', row_index))
         
         return True
         
@@ -126,34 +272,24 @@ class TableDataManager(QObject):
         # Get the row data before deletion
         row_data = self.current_data[row_index].copy()
         
-        # If it's a new row, just remove it from new_rows tracking
-        if row_index in self.new_rows:
-            del self.new_rows[row_index]
-        else:
+        # A new row only needs its tracking dropped, which removing it does
+        if self._row_ids[row_index] not in self._new_row_values:
             # Track as deleted if it's from original data
             original_row_index = self.get_original_row_index(row_index)
             if original_row_index is not None:
+                self._record_change(('deleted_row', original_row_index,
+                                     self.deleted_rows.get(original_row_index)))
                 self.deleted_rows[original_row_index] = row_data
                 
-        # Remove from current data
-        del self.current_data[row_index]
-        
-        # Update indices in tracking dictionaries (only if not in bulk operation)
-        if create_undo_point:  # This indicates it's not part of a bulk operation
-            self.update_indices_after_delete(row_index)
+        # Remove from current data, together with the row's tracking
+        self._record_change(('restore', row_index) + self._detach_row(row_index))
         
         return True
         
     def create_undo_point(self):
         """Create an undo point"""
-        current_state = {
-            'current_data': copy.deepcopy(self.current_data),
-            'modified_cells': copy.deepcopy(self.modified_cells),
-            'new_rows': copy.deepcopy(self.new_rows),
-            'deleted_rows': copy.deepcopy(self.deleted_rows)
-        }
-        
-        self.undo_stack.append(current_state)
+        # Changes made until the next undo point are journaled into this entry
+        self.undo_stack.append([])
         
         # Limit undo stack size
         if len(self.undo_stack) > self.max_undo_levels:
@@ -167,21 +303,9 @@ class TableDataManager(QObject):
         if not self.undo_stack:
             return False
             
-        # Save current state to redo stack
-        current_state = {
-            'current_data': copy.deepcopy(self.current_data),
-            'modified_cells': copy.deepcopy(self.modified_cells),
-            'new_rows': copy.deepcopy(self.new_rows),
-            'deleted_rows': copy.deepcopy(self.deleted_rows)
-        }
-        self.redo_stack.append(current_state)
-        
-        # Restore previous state
-        previous_state = self.undo_stack.pop()
-        self.current_data = previous_state['current_data']
-        self.modified_cells = previous_state['modified_cells']
-        self.new_rows = previous_state['new_rows']
-        self.deleted_rows = previous_state['deleted_rows']
+        # Revert the journaled changes; what reverts them again goes to the redo stack
+        journal = self.undo_stack.pop()
+        self.redo_stack.append([self._revert_change(change) for change in reversed(journal)])
         
         return True
         
@@ -190,78 +314,85 @@ class TableDataManager(QObject):
         if not self.redo_stack:
             return False
             
-        # Save current state to undo stack
-        current_state = {
-            'current_data': copy.deepcopy(self.current_data),
-            'modified_cells': copy.deepcopy(self.modified_cells),
-            'new_rows': copy.deepcopy(self.new_rows),
-            'deleted_rows': copy.deepcopy(self.deleted_rows)
-        }
-        self.undo_stack.append(current_state)
-        
-        # Restore next state
-        next_state = self.redo_stack.pop()
-        self.current_data = next_state['current_data']
-        self.modified_cells = next_state['modified_cells']
-        self.new_rows = next_state['new_rows']
-        self.deleted_rows = next_state['deleted_rows']
+        # Re-apply the undone changes; what reverts them again goes to the undo stack
+        journal = self.redo_stack.pop()
+        self.undo_stack.append([self._revert_change(change) for change in reversed(journal)])
         
         return True
         
+    def _record_change(self, change: Tuple):
+        """Journal how to revert a change under the latest undo point"""
+        if self.undo_stack:
+            self.undo_stack[-1].append(change)
+        # Any edit invalidates redo - its deltas were taken on the unedited table
+        self.redo_stack.clear()
+            
+    def _record_snapshot(self):
+        """Journal a full snapshot, for changes that touch every row"""
+        if self.undo_stack:
+            self._record_change(('state', self._capture_state()))
+        else:
+            # Nothing to journal under, but redo no longer applies to the edited table
+            self.redo_stack.clear()
+            
+    def _revert_change(self, change: Tuple) -> Tuple:
+        """Apply a journaled change and return the change that reverts it"""
+        kind = change[0]
+        if kind == 'cell':
+            _, row, col, value, cell_change = change
+            row_id = self._row_ids[row]
+            reverse = ('cell', row, col, self.current_data[row][col], self._get_cell_change(row_id, col))
+            self.current_data[row][col] = value
+            self._set_cell_change(row_id, col, cell_change)
+        elif kind == 'remove':
+            reverse = ('restore', change[1]) + self._detach_row(change[1])
+        elif kind == 'restore':
+            reverse = ('remove', change[1])
+            self._attach_row(*change[1:])
+        elif kind == 'remove_rows':
+            reverse = ('restore_rows', self._detach_rows(change[1]))
+        elif kind == 'restore_rows':
+            reverse = ('remove_rows', [row[0] for row in change[1]])
+            self._attach_rows(change[1])
+        elif kind == 'deleted_row':
+            _, original_row_index, row_data = change
+            reverse = ('deleted_row', original_row_index, self.deleted_rows.get(original_row_index))
+            if row_data is None:
+                self.deleted_rows.pop(original_row_index, None)
+            else:
+                self.deleted_rows[original_row_index] = row_data
+        else:
+            reverse = ('state', self._capture_state())
+            (self.current_data, self.original_data, self.column_headers, self._row_ids,
+             self._cell_changes, self._new_row_values, self.deleted_rows) = change[1]
+            self._count_row_widths()
+        return reverse
+        
+    def _capture_state(self) -> Tuple:
+        """Full copy of the table data, columns and tracking"""
+        return (copy.deepcopy(self.current_data), copy.deepcopy(self.original_data),
+                self.column_headers.copy(), self._row_ids.copy(),
+                {row_id: changes.copy() for row_id, changes in self._cell_changes.items()},
+                self._new_row_values.copy(), self.deleted_rows.copy())
+        
     def ensure_data_size(self, min_rows: int, min_cols: int):
         """Ensure current_data has at least the specified size"""
         # Add rows if needed
-        while len(self.current_data) < min_rows:
+        added_rows = max(min_rows - len(self.current_data), 0)
+        for _ in range(added_rows):
             new_row = [""] * min_cols
             self.current_data.append(new_row)
+        self._append_row_ids(added_rows)
+        if added_rows:
+            self._change_row_width_count(min_cols, added_rows)
             
-        # Add columns if needed
-        for row in self.current_data:
-            while len(row) < min_cols:
-                row.append("")
+        # Add columns if needed - only when some row is too short
+        if min_cols > self._min_row_width():
+            for row in self.current_data:
+                while len(row) < min_cols:
+                    row.append("")
+            self._count_row_widths()
                 
-    def update_indices_after_insert(self, inserted_row: int):
-        """Update row indices in tracking after row insertion"""
-        # Update modified_cells
-        new_modified_cells = {}
-        for (row, col), change in self.modified_cells.items():
-            if row >= inserted_row:
-                new_modified_cells[(row + 1, col)] = change
-            else:
-                new_modified_cells[(row, col)] = change
-        self.modified_cells = new_modified_cells
-        
-        # Update new_rows
-        new_rows = {}
-        for row, data in self.new_rows.items():
-            if row >= inserted_row:
-                new_rows[row + 1] = data
-            else:
-                new_rows[row] = data
-        self.new_rows = new_rows
-        
-    def update_indices_after_delete(self, deleted_row: int):
-        """Update row indices in tracking after row deletion"""
-        # Update modified_cells
-        new_modified_cells = {}
-        for (row, col), change in self.modified_cells.items():
-            if row > deleted_row:
-                new_modified_cells[(row - 1, col)] = change
-            elif row < deleted_row:
-                new_modified_cells[(row, col)] = change
-            # Skip the deleted row
-        self.modified_cells = new_modified_cells
-        
-        # Update new_rows
-        new_rows = {}
-        for row, data in self.new_rows.items():
-            if row > deleted_row:
-                new_rows[row - 1] = data
-            elif row < deleted_row:
-                new_rows[row] = data
-            # Skip the deleted row
-        self.new_rows = new_rows
-        
     def get_original_row_index(self, current_row: int) -> Optional[int]:
         """Get the original row index for a current row (accounting for insertions/deletions)"""
         # This is a simplified version - a more complex implementation would
@@ -272,13 +403,14 @@ class TableDataManager(QObject):
         
     def get_export_data(self) -> List[List[Any]]:
         """Get data formatted for export"""
-        return copy.deepcopy(self.current_data)
+        # Cell values are immutable (str/number), so copying the row lists is enough
+        return [row.copy() for row in self.current_data]
         
     def get_change_summary(self) -> Dict[str, Any]:
         """Get a summary of all changes made"""
         return {
-            'modified_cells_count': len(self.modified_cells),
-            'new_rows_count': len(self.new_rows),
+            'modified_cells_count': sum(len(changes) for changes in self._cell_changes.values()),
+            'new_rows_count': len(self._new_row_values),
             'deleted_rows_count': len(self.deleted_rows),
             'total_rows': len(self.current_data),
             'has_changes': self.has_unsaved_changes()
@@ -286,13 +418,15 @@ class TableDataManager(QObject):
         
     def has_unsaved_changes(self) -> bool:
         """Check if there are unsaved changes"""
-        return (len(self.modified_cells) > 0 or 
-                len(self.new_rows) > 0 or 
+        return (len(self._cell_changes) > 0 or 
+                len(self._new_row_values) > 0 or 
                 len(self.deleted_rows) > 0)
         
     def reset_to_original(self):
         """Reset all data back to original state"""
         self.current_data = copy.deepcopy(self.original_data)
+        self._reset_row_ids()
+        self._count_row_widths()
         self.clear_change_tracking()
         
     def bulk_delete_rows(self, row_indices: List[int], create_undo_point: bool = True):
@@ -312,17 +446,23 @@ class TableDataManager(QObject):
         if create_undo_point:
             self.create_undo_point()
         
-        # Sort indices in descending order to maintain correct indices during deletion
-        sorted_indices = sorted(set(row_indices), reverse=True)
+        drop_indices = sorted({row_index for row_index in row_indices
+                               if 0 <= row_index < len(self.current_data)})
         
-        deleted_count = 0
-        for row_index in sorted_indices:
-            if row_index < len(self.current_data):
-                # Delete the row (without creating individual undo points)
-                if self.delete_row(row_index, create_undo_point=False):
-                    deleted_count += 1
+        # Track deleted original rows, highest index first as row-by-row deletion did
+        for row_index in reversed(drop_indices):
+            if self._row_ids[row_index] not in self._new_row_values:
+                original_row_index = self.get_original_row_index(row_index)
+                if original_row_index is not None:
+                    self._record_change(('deleted_row', original_row_index,
+                                         self.deleted_rows.get(original_row_index)))
+                    self.deleted_rows[original_row_index] = self.current_data[row_index].copy()
+                    
+        # Remove all rows in one pass - tracking is keyed by row id, so kept rows need no reindexing
+        if drop_indices:
+            self._record_change(('restore_rows', self._detach_rows(drop_indices)))
         
-        return deleted_count > 0
+        return len(drop_indices) > 0
         
     def get_deletion_stats(self, row_indices: List[int]) -> dict:
         """
@@ -342,15 +482,14 @@ class TableDataManager(QObject):
         }
         
         for row_index in row_indices:
-            if row_index in self.new_rows:
+            row_id = self._row_ids[row_index] if 0 <= row_index < len(self._row_ids) else None
+            if row_id in self._new_row_values:
                 stats['new_rows_to_delete'] += 1
             else:
                 stats['original_rows_to_delete'] += 1
             
             # Count modified cells in this row
-            for (mod_row, mod_col) in self.modified_cells.keys():
-                if mod_row == row_index:
-                    stats['modified_cells_affected'] += 1
+            stats['modified_cells_affected'] += len(self._cell_changes.get(row_id, {}))
         
         return stats
         
@@ -370,7 +509,8 @@ class TableDataManager(QObject):
         
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(changes_data, f, indent=2, ensure_ascii=False)
+                # No indent keeps json on its C encoder
+                json.dump(changes_data, f, ensure_ascii=False)
             return True
         except Exception as e:
             print(f"Error saving changes: {e}")
@@ -386,16 +526,27 @@ class TableDataManager(QObject):
             self.current_data = changes_data.get('current_data', [])
             self.column_headers = changes_data.get('column_headers', [])
             
+            self._reset_row_ids()
+            self._count_row_widths()
+            self._cell_changes = {}
+            self._new_row_values = {}
+            
             # Restore modified_cells with tuple keys
             modified_cells_str = changes_data.get('modified_cells', {})
-            self.modified_cells = {}
             for key_str, value in modified_cells_str.items():
                 row, col = map(int, key_str.split(','))
-                self.modified_cells[(row, col)] = value
-                
-            self.new_rows = changes_data.get('new_rows', {})
+                if row < len(self._row_ids):
+                    self._set_cell_change(self._row_ids[row], col, value)
+                    
+            for row, values in changes_data.get('new_rows', {}).items():
+                if int(row) < len(self._row_ids):
+                    self._new_row_values[self._row_ids[int(row)]] = values
             self.deleted_rows = changes_data.get('deleted_rows', {})
             
+            # Journaled changes refer to the replaced data
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            
             return True
         except Exception as e:
             print(f"Error loading changes: {e}")
@@ -409,13 +560,7 @@ class TableDataManager(QObject):
         
     def get_column_data(self, col_index: int) -> List[Any]:
         """Get data for a specific column"""
-        column_data = []
-        for row in self.current_data:
-            if col_index < len(row):
-                column_data.append(row[col_index])
-            else:
-                column_data.append("")
-        return column_data
+        return [row[col_index] if col_index < len(row) else "" for row in self.current_data]
         
     def get_cell_data(self, row: int, col: int) -> Any:
         """Get data for a specific cell"""
@@ -429,6 +574,9 @@ class TableDataManager(QObject):
         
     def insert_column(self, col_index: int, header: str = ""):
         """Insert a new column at the specified index"""
+        # Journaled cell positions right of the column shift - snapshot instead
+        self._record_snapshot()
+        
         # Add to column headers
         if header:
             self.column_headers.insert(col_index, header)
@@ -438,6 +586,8 @@ class TableDataManager(QObject):
         # Add to all rows
         for row in self.current_data:
             row.insert(col_index, "")
+        self._row_widths = Counter({width + 1: count for width, count in self._row_widths.items()})
+        self._shift_cell_change_columns(col_index, 1)
             
         # Also add to original data for consistency
         for row in self.original_data:
@@ -445,6 +595,9 @@ class TableDataManager(QObject):
             
     def delete_column(self, col_index: int):
         """Delete a column at the specified index"""
+        # Journaled cell positions right of the column shift - snapshot instead
+        self._record_snapshot()
+        
         if col_index < len(self.column_headers):
             del self.column_headers[col_index]
             
@@ -452,6 +605,8 @@ class TableDataManager(QObject):
         for row in self.current_data:
             if col_index < len(row):
                 del row[col_index]
+        self._count_row_widths()
+        self._shift_cell_change_columns(col_index, -1)
                 
         # Also remove from original data
         for row in self.original_data:
@@ -4,6 +4,7 @@ Minimal entry point that delegates to appropriate modules
 """
 import sys
 import os
+import logging
 
 # Add the current directory to Python path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,6 +19,8 @@ from gui.settings import initialize_zoom_system_complete as initialize_zoom_syst
 
 def main():
     """Main entry point for the application"""
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(name)s: %(message)s")
+    
     # Check if running in GUI mode or console mode
     if len(sys.argv) > 1 and sys.argv[1] == '--console':
         # Console mode